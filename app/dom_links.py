@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+import logging
+import mmap
 import re
+import sys
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Mapping, Sequence
 from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
+from lxml import etree
 
+LOGGER = logging.getLogger(__name__)
 
-@dataclass(slots=True)
+# Hrefs and domains repeat heavily across DOM + OCR harvests and end up as dict
+# keys in ``blend_dom_with_ocr``; interning shares one object per value and lets
+# key lookups short-circuit on identity.
+_intern = sys.intern
+
+
+@dataclass(slots=True, frozen=True)
 class LinkRecord:
-    """Structured representation of an extracted anchor or form."""
+    """Structured representation of an extracted anchor or form.
+
+    Records are immutable so blended/serialized views can share instances
+    across the DOM, OCR, and API paths without defensive copies.
+    """
 
     text: str
     href: str
@@ -98,82 +114,185 @@ def extract_dom_text_overlays(html: bytes | str) -> Sequence[DomTextOverlay]:
 
 
 def extract_links_from_dom(dom_snapshot: Path) -> Sequence[LinkRecord]:
-    """Parse the DOM snapshot and return structured link records."""
+    """Parse the DOM snapshot and return structured link records.
 
-    html = dom_snapshot.read_text(encoding="utf-8")
-    soup = BeautifulSoup(html, "html.parser")
-    records: list[LinkRecord] = []
+    The snapshot is streamed through ``iterparse`` and every element is cleared
+    (and detached along with its already-seen siblings) as soon as it closes, so
+    the retained tree is bounded by the open-tag depth plus libxml2's read-ahead
+    rather than the full document. Descendants of an open ``<a>`` are kept until
+    it closes because its text is read from them. Snapshots without any
+    ``<a``/``<form`` tag (script-only SPA shells) are rejected by a byte scan over
+    the memory-mapped file before libxml2 is involved.
 
-    for anchor in soup.find_all("a"):
-        href_attr = anchor.get("href")
-        if not href_attr:
-            continue
-        # BeautifulSoup can return list for multi-value attrs; take first if list
-        href = href_attr[0] if isinstance(href_attr, list) else href_attr
-        text = anchor.get_text(strip=True)
-        rel = _normalize_rel(anchor.get("rel"))
-        target_attr = anchor.get("target")
-        target = target_attr[0] if isinstance(target_attr, list) else target_attr
-        records.append(
-            LinkRecord(
-                text=text,
-                href=href,
-                source="DOM",
-                delta="✓",
-                rel=rel,
-                target=target,
-                kind="anchor",
-                domain=_derive_domain(href),
-            )
-        )
+    libxml2 stops (without raising) at nesting depth 256; when the root element
+    never closes the snapshot is re-read with ``html.parser``, which has no such
+    limit.
+    """
 
-    for form in soup.find_all("form"):
-        action_attr = form.get("action") or ""
-        if not action_attr:
-            continue
-        # BeautifulSoup can return list for multi-value attrs; take first if list
-        action = action_attr[0] if isinstance(action_attr, list) else action_attr
-        label_attr = form.get("aria-label") or form.get("name") or "[form]"
-        label = label_attr[0] if isinstance(label_attr, list) else label_attr
-        rel = _normalize_rel(form.get("rel"))
-        target_attr = form.get("target")
-        target = target_attr[0] if isinstance(target_attr, list) else target_attr
-        records.append(
-            LinkRecord(
-                text=label,
-                href=action,
-                source="DOM",
-                delta="✓",
-                rel=rel,
-                target=target,
-                kind="form",
-                domain=_derive_domain(action),
-            )
+    records: list[LinkRecord] = []
+    with dom_snapshot.open("rb") as handle:
+        if not _has_link_tags(handle):
+            return records
+        events = etree.iterparse(
+            handle,
+            events=("start", "end"),
+            html=True,
+            encoding="utf-8",
         )
+        open_anchors = 0
+        completed = False
+        try:
+            for event, element in events:
+                tag = element.tag
+                if event == "start":
+                    if tag == "a":
+                        open_anchors += 1
+                    continue
+                if tag == "a" or tag == "form":
+                    record = _link_record_from_element(element)
+                    if record is not None:
+                        records.append(record)
+                    if tag == "a":
+                        open_anchors -= 1
+                if open_anchors:
+                    continue
+                parent = element.getparent()
+                if parent is None:
+                    completed = True
+                    continue
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del parent[0]
+        except etree.XMLSyntaxError as exc:
+            LOGGER.warning(
+                "lxml could not parse %s (%s); retrying with html.parser", dom_snapshot, exc
+            )
+            return _extract_links_with_soup(dom_snapshot)
+
+    if not completed:
+        LOGGER.warning("lxml stopped early on %s; retrying with html.parser", dom_snapshot)
+        return _extract_links_with_soup(dom_snapshot)
+    return records
 
+
+def _extract_links_with_soup(dom_snapshot: Path) -> list[LinkRecord]:
+    soup = BeautifulSoup(dom_snapshot.read_text(encoding="utf-8"), "html.parser")
+    records: list[LinkRecord] = []
+    for tag in soup.find_all(("a", "form")):
+        record = _make_link_record(tag.name, tag.attrs, lambda: tag.get_text(strip=True))
+        if record is not None:
+            records.append(record)
     return records
 
 
-_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)")
+_LINK_TAG_RE = re.compile(rb"<(?:a|form)[\s>/]", re.IGNORECASE)
+
+
+def _has_link_tags(handle: BinaryIO) -> bool:
+    try:
+        view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # zero-length files cannot be mapped
+        return False
+    with view:
+        return _LINK_TAG_RE.search(view) is not None
 
 
-def extract_links_from_markdown(markdown: str) -> Sequence[LinkRecord]:
-    """Heuristically parse Markdown links (e.g., `[text](https://example.com)`)."""
+def _link_record_from_element(element: etree._Element) -> LinkRecord | None:
+    return _make_link_record(element.tag, element.attrib, lambda: _visible_text(element))
+
+
+def _make_link_record(
+    name: str, attrib: Mapping[str, Any], anchor_text: Callable[[], str]
+) -> LinkRecord | None:
+    if name == "a":
+        href = attrib.get("href")
+        if not href:
+            return None
+        text = anchor_text()
+        kind = "anchor"
+    else:
+        href = attrib.get("action")
+        if not href:
+            return None
+        text = attrib.get("aria-label") or attrib.get("name") or "[form]"
+        kind = "form"
+    return LinkRecord(
+        text=text,
+        href=_intern(href),
+        source="DOM",
+        delta="✓",
+        rel=_normalize_rel(attrib.get("rel")),
+        target=attrib.get("target"),
+        kind=kind,
+        domain=_intern(_derive_domain(href)),
+    )
+
+
+_INVISIBLE_TAGS = frozenset({"script", "style"})
+
+
+def _visible_text(element: etree._Element) -> str:
+    """Concatenate stripped text like bs4's ``get_text(strip=True)``.
+
+    Script/style bodies and comments are skipped, but the text that follows them
+    (their tails) is kept.
+    """
+
+    parts: list[str] = []
+    _collect_visible_text(element, parts)
+    return "".join(parts)
+
+
+def _collect_visible_text(element: etree._Element, parts: list[str]) -> None:
+    if element.text:
+        parts.append(element.text.strip())
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in _INVISIBLE_TAGS:
+            _collect_visible_text(child, parts)
+        if child.tail:
+            parts.append(child.tail.strip())
+
+
+# One alternation covers every OCR link shape so the buffer is scanned once; the
+# named group that closed last (``match.lastgroup``) doubles as the record kind.
+# Link text may not span brackets and URLs are capped at 2048 chars, all matched
+# possessively: a dangling ``[`` or unterminated ``(http...`` in a large OCR dump
+# then fails in bounded time instead of rescanning to the end of the buffer. Every
+# capped run must be followed by its terminator, so a longer URL is skipped
+# rather than reported truncated.
+_OCR_LINK_RE = re.compile(
+    r"\[(?P<text>[^\[\]]++)\]\((?P<markdown>https?://[^)\s]{1,2048}+)\)"
+    r"|<(?P<autolink>https?://[^>\s]{1,2048}+)>"
+    r"|(?P<url>https?://[^\s<>()\[\]]{1,2048}+(?![^\s<>()\[\]]))"
+)
+_URL_TRAILING_PUNCTUATION = ".,;:!?'\""
+
+
+def extract_links_from_markdown(
+    markdown: str,
+    _finditer: Callable[[str], Iterator[re.Match[str]]] = _OCR_LINK_RE.finditer,
+) -> Sequence[LinkRecord]:
+    """Heuristically parse OCR links: `[text](url)`, `<url>` autolinks, and bare URLs."""
 
     if not markdown:
         return []
+    # ``_finditer`` is bound at definition time so the scan skips the global +
+    # attribute lookups; the href groups cannot contain whitespace, so only the
+    # link text needs stripping.
     records: list[LinkRecord] = []
-    for match in _MARKDOWN_LINK_RE.finditer(markdown):
-        text, href = match.groups()
-        href_value = href.strip()
+    for match in _finditer(markdown):
+        kind = match.lastgroup or "markdown"
+        href = match[kind]
+        if kind == "url":
+            href = href.rstrip(_URL_TRAILING_PUNCTUATION)
         records.append(
             LinkRecord(
-                text=text.strip(),
-                href=href_value,
+                text=match["text"].strip() if kind == "markdown" else "",
+                href=_intern(href),
                 source="OCR",
                 delta="OCR only",
-                kind="markdown",
-                domain=_derive_domain(href_value),
+                kind=kind,
+                domain=_intern(_derive_domain(href)),
             )
         )
     return records
@@ -184,70 +303,76 @@ def blend_dom_with_ocr(
     dom_links: Sequence[LinkRecord],
     ocr_links: Sequence[LinkRecord],
 ) -> Sequence[LinkRecord]:
-    """Merge DOM + OCR signals to flag mismatches for the Links tab."""
+    """Merge DOM + OCR signals to flag mismatches for the Links tab.
 
-    results: dict[str, LinkRecord] = {}
-    for record in dom_links:
-        key = record.href
-        results[key] = LinkRecord(
-            text=record.text,
-            href=record.href,
-            source="DOM",
-            delta="DOM only",
-            rel=record.rel,
-            target=record.target,
-            kind=record.kind,
-            domain=record.domain,
-        )
+    Each output record is constructed exactly once from the two href-keyed
+    views; the inputs are never mutated.
+    """
+
+    dom = {record.href: record for record in dom_links}
+    ocr = {record.href: record for record in ocr_links}
 
-    for record in ocr_links:
-        key = record.href
-        if key in results:
-            combined = results[key]
-            combined.source = "DOM+OCR"
-            if not combined.text:
-                combined.text = record.text
-            if combined.text and record.text and combined.text != record.text:
-                combined.delta = "text mismatch"
-            else:
-                combined.delta = "✓"
+    results: list[LinkRecord] = []
+    for href, record in dom.items():
+        match = ocr.get(href)
+        if match is None:
+            source, text, delta = "DOM", record.text, "DOM only"
         else:
-            results[key] = LinkRecord(
-                text=record.text,
-                href=record.href,
-                source="OCR",
-                delta="OCR only",
+            mismatch = bool(record.text and match.text and record.text != match.text)
+            source = "DOM+OCR"
+            text = record.text or match.text
+            delta = "text mismatch" if mismatch else "✓"
+        results.append(
+            LinkRecord(
+                text=text,
+                href=href,
+                source=source,
+                delta=delta,
                 rel=record.rel,
                 target=record.target,
                 kind=record.kind,
                 domain=record.domain,
             )
+        )
+
+    results.extend(
+        LinkRecord(
+            text=record.text,
+            href=href,
+            source="OCR",
+            delta="OCR only",
+            rel=record.rel,
+            target=record.target,
+            kind=record.kind,
+            domain=record.domain,
+        )
+        for href, record in ocr.items()
+        if href not in dom
+    )
+    return results
+
 
-    return list(results.values())
+_LINK_FIELDS = attrgetter("text", "href", "source", "delta", "rel", "target", "kind", "domain")
 
 
 def serialize_links(records: Iterable[LinkRecord]) -> list[dict[str, object]]:
     """Convert link records to JSON-serializable dictionaries."""
 
-    payload: list[dict[str, object]] = []
-    for record in records:
-        rel_values = list(record.rel)
-        domain = record.domain or _derive_domain(record.href)
-        markdown_text = record.text or record.href
-        payload.append(
-            {
-                "text": record.text,
-                "href": record.href,
-                "source": record.source,
-                "delta": record.delta,
-                "rel": rel_values,
-                "target": record.target,
-                "kind": record.kind,
-                "domain": domain,
-                "markdown": f"[{markdown_text}]({record.href})",
-            }
-        )
-    return payload
+    # One C-level attrgetter call per record instead of a slot-descriptor load per field.
+    return [
+        {
+            "text": text,
+            "href": href,
+            "source": source,
+            "delta": delta,
+            "rel": list(rel),
+            "target": target,
+            "kind": kind,
+            "domain": domain or _derive_domain(href),
+            "markdown": f"[{text or href}]({href})",
+        }
+        for text, href, source, delta, rel, target, kind, domain in map(_LINK_FIELDS, records)
+    ]
 
 
 def demo_dom_links() -> list[LinkRecord]:
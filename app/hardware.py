@@ -12,7 +12,7 @@ from typing import Callable, Sequence
 _MB = 1024 * 1024
 _NVIDIA_QUERY = (
     "nvidia-smi",
-    "--query-gpu=index,name,memory.total,driver_version,cuda_version",
+    "--query-gpu=index,name,memory.total,driver_version,cuda_version,pci.bus_id",
     "--format=csv,noheader,nounits",
 )
 
@@ -29,6 +29,7 @@ class GPUDeviceCapability:
     memory_total_mb: int | None = None
     driver_version: str | None = None
     runtime_version: str | None = None
+    numa_node: int | None = None
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -38,6 +39,7 @@ class GPUDeviceCapability:
             "memory_total_mb": self.memory_total_mb,
             "driver_version": self.driver_version,
             "runtime_version": self.runtime_version,
+            "numa_node": self.numa_node,
         }
 
 
@@ -67,6 +69,15 @@ class HardwareCapabilitySnapshot:
     def preferred_hardware_path(self) -> str:
         return "gpu" if self.has_gpu else "cpu"
 
+    @property
+    def gpu_numa_node(self) -> int | None:
+        """NUMA node shared by every detected GPU, or ``None`` when unknown/mixed."""
+
+        nodes = {device.numa_node for device in self.gpu_devices}
+        if len(nodes) != 1:
+            return None
+        return nodes.pop()
+
     def to_dict(self) -> dict[str, object]:
         return {
             "os_platform": self.os_platform,
@@ -116,11 +127,12 @@ def _detect_nvidia_gpus(runner: CommandRunner) -> tuple[list[GPUDeviceCapability
 
     devices: list[GPUDeviceCapability] = []
     for line in lines:
-        parts = [part.strip() for part in line.split(",", maxsplit=4)]
+        parts = [part.strip() for part in line.split(",", maxsplit=5)]
         if len(parts) < 5:
             warnings.append("nvidia-smi-parse-error")
             continue
-        index_raw, name, memory_raw, driver_version, cuda_version = parts
+        index_raw, name, memory_raw, driver_version, cuda_version = parts[:5]
+        bus_id = parts[5] if len(parts) > 5 else ""
         try:
             index = int(index_raw)
         except ValueError:
@@ -139,11 +151,27 @@ def _detect_nvidia_gpus(runner: CommandRunner) -> tuple[list[GPUDeviceCapability
                 memory_total_mb=memory_total_mb,
                 driver_version=driver_version or None,
                 runtime_version=cuda_version or None,
+                numa_node=_pci_numa_node(bus_id),
             )
         )
     return devices, warnings
 
 
+def _pci_numa_node(bus_id: str) -> int | None:
+    """Map an nvidia-smi PCI bus id (``00000000:3B:00.0``) to its sysfs NUMA node."""
+
+    domain, sep, rest = bus_id.partition(":")
+    if not sep:
+        return None
+    device = f"{domain[-4:]}:{rest}".lower()
+    try:
+        with open(f"/sys/bus/pci/devices/{device}/numa_node", encoding="utf-8") as handle:
+            node = int(handle.read().strip())
+    except (OSError, ValueError):
+        return None
+    return node if node >= 0 else None
+
+
 def _detect_torch_gpus() -> tuple[list[GPUDeviceCapability], list[str]]:
     try:
         import torch  # type: ignore[import-not-found]
@@ -6,14 +6,15 @@ import asyncio
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from importlib import metadata
 import time
 from typing import Any, Awaitable, Callable, Dict, List, Mapping, Sequence, TypedDict, cast
-from uuid import uuid4
 
 import hashlib
 import hmac
 import json
+import secrets
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 import logging
 
@@ -31,7 +32,7 @@ from app.dom_links import (
     extract_links_from_markdown,
     serialize_links,
 )
-from app.hardware import get_host_capabilities
+from app.hardware import HardwareCapabilitySnapshot, get_host_capabilities
 from app.ocr_client import OCRRequest, SubmitTilesResult, resolve_ocr_backend, submit_tiles
 from app.schemas import JobCreateRequest, ManifestMetadata
 from app.settings import Settings, settings as global_settings
@@ -43,6 +44,8 @@ LOGGER = logging.getLogger(__name__)
 
 WebhookSender = Callable[[str, dict[str, Any]], Awaitable[None]]
 _EVENT_HISTORY_LIMIT = 500
+# Snapshots are idempotent, so a slow SSE consumer only needs the latest few.
+_SUBSCRIBER_QUEUE_SIZE = 2
 
 try:  # Playwright may be missing in some CI environments
     PLAYWRIGHT_VERSION = metadata.version("playwright")
@@ -97,18 +100,10 @@ def build_initial_snapshot(
     manifest = None
     active_settings = settings or global_settings
     if active_settings:
-        capability_snapshot = get_host_capabilities()
-        backend = resolve_ocr_backend(active_settings, capabilities=capability_snapshot)
-        manifest = ManifestMetadata(
-            environment=active_settings.manifest_environment(playwright_version=PLAYWRIGHT_VERSION),
-            backend_id=backend.backend_id,
-            backend_mode=backend.backend_mode,
-            hardware_path=backend.hardware_path,
-            backend_reason_codes=list(backend.reason_codes),
-            backend_reevaluate_after_s=backend.reevaluate_after_s,
-            fallback_chain=list(backend.fallback_chain),
-            hardware_capabilities=capability_snapshot.to_dict(),
-        )
+        template = _manifest_template(active_settings, get_host_capabilities(), PLAYWRIGHT_VERSION)
+        manifest = _copy_containers(template)
+        manifest["profile_id"] = profile_id
+        manifest["cache_hit"] = cache_hit
 
     snapshot = JobSnapshot(
         id=job_id,
@@ -127,12 +122,45 @@ def build_initial_snapshot(
     snapshot["seam_hash_count"] = None
     snapshot["seam_markers"] = []
     if manifest:
-        manifest.profile_id = profile_id
-        manifest.cache_hit = cache_hit
-        snapshot["manifest"] = manifest.model_dump()
+        snapshot["manifest"] = manifest
     return snapshot
 
 
+@lru_cache(maxsize=4)
+def _manifest_template(
+    settings: Settings,
+    capability_snapshot: HardwareCapabilitySnapshot,
+    playwright_version: str | None,
+) -> dict[str, Any]:
+    """Dump the per-process manifest baseline once per settings/host snapshot.
+
+    Settings and capability snapshots are frozen, so they key the cache by value.
+    The returned dict is shared; callers take a ``_copy_containers`` copy first.
+    """
+
+    backend = resolve_ocr_backend(settings, capabilities=capability_snapshot)
+    return ManifestMetadata(
+        environment=settings.manifest_environment(playwright_version=playwright_version),
+        backend_id=backend.backend_id,
+        backend_mode=backend.backend_mode,
+        hardware_path=backend.hardware_path,
+        backend_reason_codes=list(backend.reason_codes),
+        backend_reevaluate_after_s=backend.reevaluate_after_s,
+        fallback_chain=list(backend.fallback_chain),
+        hardware_capabilities=capability_snapshot.to_dict(),
+    ).model_dump()
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy nested dicts/lists (scalars are shared) so each job owns its manifest."""
+
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    return value
+
+
 RunnerType = Callable[..., Awaitable[tuple[CaptureResult, list[dict[str, object]]]]]
 
 
@@ -152,6 +180,8 @@ class JobManager:
         self._snapshots: Dict[str, JobSnapshot] = {}
         self._tasks: Dict[str, asyncio.Task[None]] = {}
         self._subscribers: Dict[str, List[asyncio.Queue[JobSnapshot]]] = {}
+        self._pending_payloads: Dict[str, JobSnapshot] = {}
+        self._flush_handle: asyncio.Handle | None = None
         self._event_logs: Dict[str, List[dict[str, Any]]] = {}
         self._event_sequences: Dict[str, int] = {}
         self._event_subscribers: Dict[str, List[asyncio.Queue[dict[str, Any]]]] = {}
@@ -164,7 +194,7 @@ class JobManager:
         self._shutdown = False
 
     async def create_job(self, request: JobCreateRequest) -> JobSnapshot:
-        job_id = uuid4().hex
+        job_id = secrets.token_hex(16)
         active_settings = global_settings
         capture_config = _build_capture_config(request, active_settings)
         cache_seed = _build_cache_seed(config=capture_config, settings=active_settings)
@@ -177,7 +207,7 @@ class JobManager:
             profile_id=capture_config.profile_id,
             cache_hit=False,
         )
-        self._snapshots[job_id] = snapshot.copy()
+        self._snapshots[job_id] = snapshot
         self._event_logs[job_id] = []
         self._event_sequences[job_id] = 0
         self._cache_keys[job_id] = cache_key
@@ -197,7 +227,6 @@ class JobManager:
             total_tiles = cache_record.tiles_total or manifest.get("tiles_total") or 0
             snapshot["progress"] = {"done": total_tiles, "total": total_tiles}
             snapshot["artifacts"] = self.store.read_artifacts(cache_record.id)
-            self._snapshots[job_id] = snapshot.copy()
             self._record_custom_event(
                 job_id,
                 "cache_hit",
@@ -266,7 +295,7 @@ class JobManager:
     def subscribe(self, job_id: str) -> asyncio.Queue[JobSnapshot]:
         if job_id not in self._snapshots:
             raise KeyError(f"Job {job_id} not found")
-        queue: asyncio.Queue[JobSnapshot] = asyncio.Queue()
+        queue: asyncio.Queue[JobSnapshot] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
         queue.put_nowait(self._snapshot_payload(job_id))
         self._subscribers.setdefault(job_id, []).append(queue)
         return queue
@@ -615,12 +644,44 @@ class JobManager:
         _persist_pending_webhooks(self.store, pending, job_id)
 
     def _broadcast(self, job_id: str) -> None:
+        # ``_snapshot_payload`` already returns a detached copy; every subscriber,
+        # the event log, and webhooks share it read-only instead of copying per queue.
         payload = self._snapshot_payload(job_id)
         self._record_event(job_id, payload)
-        for queue in list(self._subscribers.get(job_id, [])):
-            queue.put_nowait(payload.copy())
+        if self._subscribers.get(job_id):
+            self._schedule_flush(job_id, payload)
         self._maybe_trigger_webhooks(job_id, payload)
 
+    def _schedule_flush(self, job_id: str, payload: JobSnapshot) -> None:
+        """Coalesce subscriber fan-out to one delivery per job per loop iteration.
+
+        Bursts of state/error updates inside a single callback only wake SSE
+        consumers once, with the latest snapshot. The event log and webhooks are
+        still fed synchronously so no transition is lost there.
+        """
+
+        self._pending_payloads[job_id] = payload
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_subscribers()
+            return
+        self._flush_handle = loop.call_soon(self._flush_subscribers)
+
+    def _flush_subscribers(self) -> None:
+        self._flush_handle = None
+        pending, self._pending_payloads = self._pending_payloads, {}
+        for job_id, payload in pending.items():
+            for queue in list(self._subscribers.get(job_id, [])):
+                try:
+                    queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    # Evict the oldest pending snapshot so the latest state stays deliverable.
+                    queue.get_nowait()
+                    queue.put_nowait(payload)
+
     def _snapshot_payload(self, job_id: str) -> JobSnapshot:
         snapshot = self._snapshots.get(job_id)
         if snapshot is None:
@@ -658,7 +719,7 @@ class JobManager:
         if len(log) > _EVENT_HISTORY_LIMIT:
             del log[: len(log) - _EVENT_HISTORY_LIMIT]
         for queue in list(self._event_subscribers.get(job_id, [])):
-            queue.put_nowait(enriched.copy())
+            queue.put_nowait(enriched)
 
     def _parse_timestamp(self, raw: Any) -> datetime | None:
         if not isinstance(raw, str):
@@ -726,12 +787,14 @@ async def execute_capture_job(
     *,
     job_id: str,
     url: str,
-    store: Store | None = None,
+    store: Store,
     config: CaptureConfig | None = None,
 ) -> tuple[CaptureResult, list[dict[str, object]]]:
-    """Run the capture pipeline, persisting artifacts + manifest via ``Store``."""
+    """Run the capture pipeline, persisting artifacts + manifest via ``Store``.
 
-    storage = store or build_store()
+    Callers own the ``Store`` (``JobManager.store`` or the worker context) so
+    repeated jobs reuse one engine instead of constructing a store per capture.
+    """
 
     capture_config = config or CaptureConfig(url=url)
     try:
@@ -749,23 +812,23 @@ async def execute_capture_job(
         dom_path = None
         dom_links: Sequence[LinkRecord] = []
         if dom_snapshot:
-            dom_path = storage.write_dom_snapshot(job_id=job_id, html=dom_snapshot)
-        write_links = getattr(storage, "write_links", None)
+            dom_path = store.write_dom_snapshot(job_id=job_id, html=dom_snapshot)
+        write_links = getattr(store, "write_links", None)
         if dom_path and callable(write_links):
             try:
                 dom_links = extract_links_from_dom(dom_path)
                 write_links(job_id=job_id, links=serialize_links(dom_links))
             except Exception as exc:  # pragma: no cover - log and continue
                 LOGGER.warning("Failed to extract DOM links for %s: %s", job_id, exc)
-        tile_artifacts = storage.write_tiles(job_id=job_id, tiles=capture_result.tiles)
-        storage.write_manifest(job_id=job_id, manifest=capture_result.manifest)
+        tile_artifacts = store.write_tiles(job_id=job_id, tiles=capture_result.tiles)
+        store.write_manifest(job_id=job_id, manifest=capture_result.manifest)
         if markdown:
-            storage.write_markdown(job_id=job_id, content=markdown)
+            store.write_markdown(job_id=job_id, content=markdown)
         blended_links: Sequence[LinkRecord] = dom_links
         if ocr_links:
             blended_links = blend_dom_with_ocr(dom_links=dom_links, ocr_links=ocr_links)
         if blended_links and callable(write_links):
-            storage.write_links(job_id=job_id, links=serialize_links(blended_links))
+            store.write_links(job_id=job_id, links=serialize_links(blended_links))
     except Exception:
         raise
 
@@ -828,16 +891,19 @@ async def _run_ocr_pipeline(
     dom_snapshot = capture_result.dom_snapshot
     if dom_snapshot:
         try:
-            dom_headings = extract_headings_from_html(dom_snapshot)
+            dom_headings = await asyncio.to_thread(extract_headings_from_html, dom_snapshot)
         except Exception as exc:  # pragma: no cover - defensive logging
             LOGGER.warning("Failed to parse DOM headings for %s: %s", job_id, exc)
         try:
-            dom_overlays = extract_dom_text_overlays(dom_snapshot)
+            dom_overlays = await asyncio.to_thread(extract_dom_text_overlays, dom_snapshot)
         except Exception as exc:  # pragma: no cover - defensive logging
             LOGGER.warning("Failed to parse DOM overlays for %s: %s", job_id, exc)
 
+    # DOM parsing and stitching are CPU-bound Python; run them off the event loop so
+    # other jobs' SSE streams and OCR uploads keep flowing on large captures.
     stitch_start = time.perf_counter()
-    stitch_result = stitch_markdown(
+    stitch_result = await asyncio.to_thread(
+        stitch_markdown,
         ocr_output.markdown_chunks,
         tiles,
         dom_headings=dom_headings,
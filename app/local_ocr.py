@@ -5,19 +5,31 @@ from __future__ import annotations
 import argparse
 import asyncio
 import atexit
-import base64
 import logging
-from dataclasses import dataclass, replace
-import subprocess
+import math
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+import os
+import random
+import select
+import shutil
+import signal
 import sys
 import time
+import weakref
 from typing import Sequence
 from urllib.parse import urlparse
 
 import httpx
+import orjson
+
+try:  # SIMD (SSSE3/AVX2) base64 from the local-ocr extra; same API as the stdlib
+    import pybase64 as base64
+except ImportError:  # pragma: no cover - stdlib fallback
+    import base64  # type: ignore[no-redef]
 
 from app.hardware import HardwareCapabilitySnapshot, get_host_capabilities
-from app.settings import Settings, get_settings
+from app.settings import OCRSettings, Settings, get_settings
 
 LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +37,47 @@ _DEFAULT_LOCAL_ENDPOINT = "http://127.0.0.1:8001/v1"
 _MODEL_ALIASES = {
     "glm-ocr": "zai-org/GLM-4.1V-9B-Thinking",
 }
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_DEFAULT_TILE_PROMPT = "Convert this image to markdown preserving structure and text."
+_IMAGE_PLACEHOLDER = "@@mdwb-tile-base64@@"
+_SHUTDOWN_GRACE_S = 1.0
+_READY_POLL_INITIAL_S = 0.1
+_READY_POLL_MAX_S = 0.5
+_LOCAL_HEALTH_MAX = 8
+# Minimum gap between spawn rounds across ensure_service calls: a server that keeps
+# dying right after launch is not relaunched in a tight loop by every caller that
+# finds it unhealthy.
+_SPAWN_COOLDOWN_S = 5.0
+# Single-flight key: endpoint plus every per-call input the probe/spawn depends on.
+_InflightKey = tuple[str, OCRSettings, HardwareCapabilitySnapshot | None, str | None]
+# Health probes reuse one keep-alive client per event loop; httpx pools are
+# bound to the loop that opened them, so a process-wide singleton would break
+# under the per-test loops pytest-asyncio creates.
+_PROBE_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+_STATUS_REQUIRED_KEYS = (
+    "enabled",
+    "endpoint",
+    "healthy",
+    "action",
+    "managed",
+    "launch_attempts",
+    "restart_count",
+)
+_STATUS_OPTIONAL_KEYS = (
+    "reason",
+    "pid",
+    "startup_ms",
+    "status_code",
+    "probe_url",
+    "command",
+    "hardware_path",
+    "model",
+    "served_model_name",
+)
 
 
 @dataclass(slots=True, frozen=True)
@@ -48,34 +101,22 @@ class LocalOCRServiceStatus:
     model: str | None = None
     served_model_name: str | None = None
 
+    # Filled lazily by ``to_dict``; cached statuses are re-serialized per OCR request.
+    _payload: dict[str, object] | None = field(default=None, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict[str, object]:
-        payload: dict[str, object] = {
-            "enabled": self.enabled,
-            "endpoint": self.endpoint,
-            "healthy": self.healthy,
-            "action": self.action,
-            "managed": self.managed,
-            "launch_attempts": self.launch_attempts,
-            "restart_count": self.restart_count,
-        }
-        if self.reason is not None:
-            payload["reason"] = self.reason
-        if self.pid is not None:
-            payload["pid"] = self.pid
-        if self.startup_ms is not None:
-            payload["startup_ms"] = self.startup_ms
-        if self.status_code is not None:
-            payload["status_code"] = self.status_code
-        if self.probe_url is not None:
-            payload["probe_url"] = self.probe_url
+        cached = self._payload
+        if cached is None:
+            cached = {key: getattr(self, key) for key in _STATUS_REQUIRED_KEYS}
+            cached.update(
+                (key, value)
+                for key in _STATUS_OPTIONAL_KEYS
+                if (value := getattr(self, key)) is not None and value != ()
+            )
+            object.__setattr__(self, "_payload", cached)
+        payload = dict(cached)
         if self.command:
             payload["command"] = list(self.command)
-        if self.hardware_path is not None:
-            payload["hardware_path"] = self.hardware_path
-        if self.model is not None:
-            payload["model"] = self.model
-        if self.served_model_name is not None:
-            payload["served_model_name"] = self.served_model_name
         return payload
 
 
@@ -95,7 +136,7 @@ class LocalOCRServiceManager:
 
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
-        self._process: subprocess.Popen[str] | None = None
+        self._process: asyncio.subprocess.Process | None = None
         self._endpoint: str | None = None
         self._launch_attempts = 0
         self._restart_count = 0
@@ -103,6 +144,13 @@ class LocalOCRServiceManager:
         self._last_model: str | None = None
         self._last_served_model_name: str | None = None
         self._last_hardware_path: str | None = None
+        self._healthy_status: LocalOCRServiceStatus | None = None
+        self._healthy_until = 0.0
+        self._inflight: dict[_InflightKey, asyncio.Future[LocalOCRServiceStatus]] = {}
+        # SWIM-style local health multiplier: a saturating count of recent readiness
+        # misses that stretches probe timeouts across restarts of a slow server.
+        self._local_health = 0
+        self._last_spawn_at: float | None = None
 
     async def ensure_service(
         self,
@@ -135,6 +183,48 @@ class LocalOCRServiceManager:
                 reason=f"invalid-local-url:{exc}",
             )
 
+        # Lock-free hit path: a recent successful probe of this endpoint is reused
+        # verbatim, skipping the HTTP round trip for per-page callers.
+        cached = self._healthy_status
+        if (
+            cached is not None
+            and cached.endpoint == normalized_endpoint
+            and time.monotonic() < self._healthy_until
+        ):
+            return cached
+
+        # Single-flight: concurrent callers for one endpoint share a single
+        # probe (and, if needed, a single spawn) instead of each probing. The
+        # outcome also depends on the caller's OCR settings (autostart, timeouts)
+        # and hardware inputs, so only callers that agree on those share it.
+        key: _InflightKey = (
+            normalized_endpoint,
+            cfg.ocr,
+            capabilities,
+            preferred_hardware_path,
+        )
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._probe_or_start(
+                    cfg,
+                    normalized_endpoint,
+                    capabilities=capabilities,
+                    preferred_hardware_path=preferred_hardware_path,
+                )
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return await asyncio.shield(inflight)
+
+    async def _probe_or_start(
+        self,
+        cfg: Settings,
+        normalized_endpoint: str,
+        *,
+        capabilities: HardwareCapabilitySnapshot | None,
+        preferred_hardware_path: str | None,
+    ) -> LocalOCRServiceStatus:
         status_code: int | None
         probe_url: str | None
         healthy, status_code, probe_url = await _probe_health(
@@ -143,9 +233,9 @@ class LocalOCRServiceManager:
         )
         if healthy:
             process = self._process
-            pid = process.pid if process and process.poll() is None else None
+            pid = process.pid if process and process.returncode is None else None
             managed = pid is not None and self._endpoint == normalized_endpoint
-            return LocalOCRServiceStatus(
+            status = LocalOCRServiceStatus(
                 enabled=True,
                 endpoint=normalized_endpoint,
                 healthy=True,
@@ -162,6 +252,7 @@ class LocalOCRServiceManager:
                 model=self._last_model,
                 served_model_name=self._last_served_model_name,
             )
+            return self._remember_healthy(status, cfg)
 
         if not cfg.ocr.local_autostart:
             return LocalOCRServiceStatus(
@@ -188,9 +279,9 @@ class LocalOCRServiceManager:
             )
             if healthy:
                 process = self._process
-                pid = process.pid if process and process.poll() is None else None
+                pid = process.pid if process and process.returncode is None else None
                 managed = pid is not None and self._endpoint == normalized_endpoint
-                return LocalOCRServiceStatus(
+                status = LocalOCRServiceStatus(
                     enabled=True,
                     endpoint=normalized_endpoint,
                     healthy=True,
@@ -207,9 +298,29 @@ class LocalOCRServiceManager:
                     model=self._last_model,
                     served_model_name=self._last_served_model_name,
                 )
+                return self._remember_healthy(status, cfg)
 
+            self._healthy_status = None
+            last_spawn_at = self._last_spawn_at
+            if last_spawn_at is not None and time.monotonic() - last_spawn_at < _SPAWN_COOLDOWN_S:
+                return LocalOCRServiceStatus(
+                    enabled=True,
+                    endpoint=normalized_endpoint,
+                    healthy=False,
+                    action="unavailable",
+                    reason="spawn-cooldown",
+                    managed=False,
+                    launch_attempts=self._launch_attempts,
+                    restart_count=self._restart_count,
+                    status_code=status_code,
+                    probe_url=probe_url,
+                    command=self._last_command,
+                    hardware_path=self._last_hardware_path,
+                    model=self._last_model,
+                    served_model_name=self._last_served_model_name,
+                )
             if self._process is not None:
-                await asyncio.to_thread(_terminate_process, self._process)
+                await _terminate_process(self._process)
                 self._process = None
                 self._endpoint = None
 
@@ -229,13 +340,16 @@ class LocalOCRServiceManager:
             last_reason = "startup-timeout"
             for attempt_idx in range(max_attempts):
                 self._launch_attempts += 1
+                self._last_spawn_at = time.monotonic()
                 startup = time.perf_counter()
                 try:
-                    process = subprocess.Popen(
-                        list(plan.command),
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.STDOUT,
-                        text=True,
+                    # Own session: a Ctrl-C aimed at the API process must not tear
+                    # down vLLM behind the manager's back; shutdown paths stop it.
+                    process = await asyncio.create_subprocess_exec(
+                        *plan.command,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL,
+                        start_new_session=True,
                     )
                 except (FileNotFoundError, OSError) as exc:
                     last_reason = f"spawn-failed:{exc.__class__.__name__}"
@@ -266,7 +380,7 @@ class LocalOCRServiceManager:
                 last_startup_ms = int((time.perf_counter() - startup) * 1000)
                 if ready:
                     action = "started" if attempt_idx == 0 else "restarted"
-                    return LocalOCRServiceStatus(
+                    status = LocalOCRServiceStatus(
                         enabled=True,
                         endpoint=plan.endpoint,
                         healthy=True,
@@ -282,8 +396,12 @@ class LocalOCRServiceManager:
                         model=plan.model,
                         served_model_name=plan.served_model_name,
                     )
+                    self._remember_healthy(
+                        replace(status, action="reused", reason="service-healthy"), cfg
+                    )
+                    return status
 
-                await asyncio.to_thread(_terminate_process, process)
+                await _terminate_process(process)
                 self._process = None
                 self._endpoint = None
                 last_reason = "startup-timeout"
@@ -312,36 +430,91 @@ class LocalOCRServiceManager:
                 served_model_name=plan.served_model_name,
             )
 
+    def _forget_inflight(
+        self, key: _InflightKey, future: asyncio.Future[LocalOCRServiceStatus]
+    ) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def _remember_healthy(
+        self, status: LocalOCRServiceStatus, cfg: Settings
+    ) -> LocalOCRServiceStatus:
+        self._healthy_status = status
+        self._healthy_until = time.monotonic() + max(0.0, cfg.ocr.local_health_cache_s)
+        return status
+
     async def _wait_until_ready(
         self,
         *,
         endpoint: str,
-        process: subprocess.Popen[str],
+        process: asyncio.subprocess.Process,
         startup_timeout_s: int,
         health_timeout_s: int,
     ) -> bool:
+        # ``Process.wait`` resolves from the loop's child watcher (pidfd-backed on
+        # Linux), so an early crash wakes the waiter immediately.
+        exited = asyncio.ensure_future(process.wait())
         deadline = time.monotonic() + max(1, startup_timeout_s)
-        while time.monotonic() < deadline:
-            if process.poll() is not None:
-                return False
-            healthy, _, _ = await _probe_health(endpoint, timeout=max(1, health_timeout_s))
-            if healthy:
-                return True
-            await asyncio.sleep(1)
-        return False
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                if exited.done():
+                    return False
+                # A warming server may accept connections long before it answers
+                # quickly; the local health multiplier widens the per-probe timeout
+                # (and poll interval) with each miss, never past the budget left.
+                multiplier = self._local_health + 1
+                probe_timeout = min(max(1, health_timeout_s) * multiplier, math.ceil(remaining))
+                probe = asyncio.ensure_future(_probe_health(endpoint, timeout=probe_timeout))
+                await asyncio.wait({probe, exited}, return_when=asyncio.FIRST_COMPLETED)
+                if not probe.done():
+                    probe.cancel()
+                    return False
+                healthy, _, _ = probe.result()
+                if healthy:
+                    self._local_health = max(0, self._local_health - 1)
+                    return True
+                self._local_health = min(_LOCAL_HEALTH_MAX, self._local_health + 1)
+                interval = min(
+                    _READY_POLL_INITIAL_S * (self._local_health + 1), _READY_POLL_MAX_S
+                )
+                await asyncio.wait(
+                    {exited}, timeout=interval + random.uniform(0, _READY_POLL_INITIAL_S)
+                )
+            return False
+        finally:
+            exited.cancel()
 
     def shutdown(self) -> None:
+        """Best-effort synchronous stop for interpreter exit, when no loop can await.
+
+        Sends SIGTERM, allows a one-second grace period, then SIGKILLs and returns
+        without waiting so container/CI teardown is never held up by vLLM.
+        """
+
         process = self._process
         self._process = None
         self._endpoint = None
-        if process is not None:
-            _terminate_process(process)
+        self._healthy_status = None
+        self._inflight.clear()
+        self._local_health = 0
+        self._last_spawn_at = None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            os.kill(process.pid, signal.SIGTERM)
+        except OSError:
+            return
+        if not _wait_for_exit(process.pid, _SHUTDOWN_GRACE_S):
+            try:
+                os.kill(process.pid, signal.SIGKILL)
+            except OSError:
+                return
 
-    def current_process(self) -> subprocess.Popen[str] | None:
+    def current_process(self) -> asyncio.subprocess.Process | None:
         process = self._process
         if process is None:
             return None
-        if process.poll() is not None:
+        if process.returncode is not None:
             return None
         return process
 
@@ -358,60 +531,104 @@ class LocalOCRClient:
         self.endpoint = endpoint
         self.model = model
         self.timeout = timeout
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> LocalOCRClient:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
 
     async def process_tile(self, tile_bytes: bytes, prompt: str | None = None) -> str:
-        image_b64 = base64.b64encode(tile_bytes).decode("utf-8")
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                            or "Convert this image to markdown preserving structure and text.",
-                        },
-                        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{image_b64}"}},
-                    ],
-                }
-            ],
-            "max_tokens": 4096,
-            "temperature": 0.0,
-        }
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(self.endpoint, json=payload)
-            response.raise_for_status()
-            data = response.json()
-        choices = data.get("choices")
-        if isinstance(choices, list) and choices:
-            first = choices[0]
-            if isinstance(first, dict):
-                message = first.get("message")
-                if isinstance(message, dict):
-                    content = message.get("content")
-                    if isinstance(content, str) and content.strip():
-                        return content.strip()
-                text_value = first.get("text")
-                if isinstance(text_value, str) and text_value.strip():
-                    return text_value.strip()
+        # vLLM's OpenAI-compatible route only accepts inline data URLs. The JSON
+        # scaffold around the image is constant per (model, prompt), so it is
+        # serialized once and the raw base64 bytes are spliced straight in.
+        prefix, suffix = _chat_request_template(self.model, prompt or _DEFAULT_TILE_PROMPT)
+        response = await self._client.post(
+            self.endpoint,
+            content=b"".join((prefix, base64.b64encode(tile_bytes), suffix)),
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        # The OpenAI schema is fixed, so index straight in and treat any shape
+        # mismatch (missing key, empty list, null, non-string) as "not here".
+        try:
+            content = data["choices"][0]["message"]["content"].strip()
+        except (KeyError, IndexError, TypeError, AttributeError):
+            content = ""
+        if content:
+            return content
+        try:
+            text_value = data["choices"][0]["text"].strip()
+        except (KeyError, IndexError, TypeError, AttributeError):
+            text_value = ""
+        if text_value:
+            return text_value
         raise ValueError("Unexpected local OCR response shape")
 
     async def process_batch(self, tiles: Sequence[bytes], batch_size: int = 3) -> list[str]:
-        results: list[str] = []
-        for idx in range(0, len(tiles), max(1, batch_size)):
-            batch = tiles[idx : idx + max(1, batch_size)]
-            jobs = [self.process_tile(tile) for tile in batch]
-            batch_results = await asyncio.gather(*jobs, return_exceptions=True)
-            for value in batch_results:
-                if isinstance(value, BaseException):
-                    LOGGER.warning("Local OCR tile failed: %s", value)
-                    results.append("")
-                else:
-                    results.append(value)
+        """OCR ``tiles`` through ``batch_size`` workers draining a shared queue.
+
+        Every tile is queued up front and each worker pulls the next one as soon
+        as it finishes, so a slow tile never holds back its neighbours. Results
+        keep tile order; failed tiles come back as empty strings.
+        """
+
+        queue: asyncio.Queue[tuple[int, bytes]] = asyncio.Queue()
+        for item in enumerate(tiles):
+            queue.put_nowait(item)
+        results = [""] * len(tiles)
+
+        async def _worker() -> None:
+            while True:
+                try:
+                    index, tile = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[index] = await self.process_tile(tile)
+                except Exception as exc:  # one bad tile must not sink the batch
+                    LOGGER.warning("Local OCR tile failed: %s", exc)
+
+        workers = min(max(1, batch_size), len(tiles))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
         return results
 
 
+@lru_cache(maxsize=16)
+def _chat_request_template(model: str, prompt: str) -> tuple[bytes, bytes]:
+    """Return the JSON bytes before/after the base64 image for a chat OCR request."""
+
+    payload = {
+        "model": model,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:image/png;base64,{_IMAGE_PLACEHOLDER}"},
+                    },
+                ],
+            }
+        ],
+        "max_tokens": 4096,
+        "temperature": 0.0,
+    }
+    # The image URL is serialized after the prompt, so splitting on the last
+    # placeholder is safe even if a prompt happens to contain it.
+    prefix, _, suffix = orjson.dumps(payload).rpartition(_IMAGE_PLACEHOLDER.encode("ascii"))
+    return prefix, suffix
+
+
 _SERVICE_MANAGER = LocalOCRServiceManager()
 
 
@@ -434,6 +651,7 @@ def get_local_ocr_service_manager() -> LocalOCRServiceManager:
     return _SERVICE_MANAGER
 
 
+@lru_cache(maxsize=32)
 def _normalize_endpoint(local_url: str) -> str:
     parsed = urlparse(local_url)
     if parsed.scheme not in {"http", "https"}:
@@ -451,40 +669,63 @@ def _normalize_endpoint(local_url: str) -> str:
     return f"{parsed.scheme}://{parsed.netloc}{path}"
 
 
+@lru_cache(maxsize=32)
 def _probe_candidates(endpoint: str) -> tuple[str, ...]:
     endpoint = endpoint.rstrip("/")
     parsed = urlparse(endpoint)
-    base = f"{parsed.scheme}://{parsed.netloc}"
-    candidates: list[str] = []
-    if endpoint.endswith("/v1"):
-        candidates.append(f"{endpoint}/models")
-    else:
-        candidates.append(f"{endpoint}/models")
-    candidates.append(f"{base}/health")
-    deduped: list[str] = []
-    for candidate in candidates:
-        if candidate not in deduped:
-            deduped.append(candidate)
-    return tuple(deduped)
+    return (f"{endpoint}/models", f"{parsed.scheme}://{parsed.netloc}/health")
 
 
 async def _probe_health(endpoint: str, *, timeout: int) -> tuple[bool, int | None, str | None]:
     timeout_seconds = max(1, timeout)
     last_status: int | None = None
     last_url: str | None = None
-    async with httpx.AsyncClient(timeout=timeout_seconds, http2=True) as client:
-        for probe_url in _probe_candidates(endpoint):
-            try:
-                response = await client.get(probe_url)
-            except Exception:
-                continue
-            last_status = response.status_code
-            last_url = probe_url
-            if response.status_code < 500:
-                return True, response.status_code, probe_url
+    client = _get_probe_client()
+    # Probe every candidate at once and take the first non-5xx answer, so an
+    # unreachable ``/models`` no longer burns the full timeout before ``/health``.
+    probes = {
+        asyncio.ensure_future(client.get(probe_url, timeout=timeout_seconds)): probe_url
+        for probe_url in _probe_candidates(endpoint)
+    }
+    pending: set[asyncio.Future[httpx.Response]] = set(probes)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for probe in done:
+                if probe.exception() is not None:
+                    continue
+                response = probe.result()
+                last_status = response.status_code
+                last_url = probes[probe]
+                if response.status_code < 500:
+                    return True, response.status_code, last_url
+    finally:
+        for probe in pending:
+            probe.cancel()
     return False, last_status, last_url
 
 
+def _get_probe_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _PROBE_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        # Plain HTTP/1.1 keep-alive: a single-stream GET over loopback gains nothing
+        # from h2's SETTINGS exchange and HPACK state.
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=2, max_connections=4),
+        )
+        _PROBE_CLIENTS[loop] = client
+    return client
+
+
+async def close_local_ocr_clients() -> None:
+    """Close the keep-alive health-probe client owned by the running loop."""
+
+    client = _PROBE_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 def _resolve_launch_model(model: str) -> tuple[str, str | None]:
     normalized = model.strip()
     if not normalized:
@@ -502,15 +743,26 @@ def _build_start_plan(
     capabilities: HardwareCapabilitySnapshot,
     preferred_hardware_path: str | None,
 ) -> _StartPlan:
-    parsed = urlparse(endpoint)
-    host = parsed.hostname or "127.0.0.1"
-    port = parsed.port or 8001
-
     hardware_path = preferred_hardware_path or capabilities.preferred_hardware_path
     if hardware_path not in {"gpu", "cpu"}:
         hardware_path = capabilities.preferred_hardware_path
+    return _plan_for(settings.ocr.model, endpoint, capabilities, hardware_path)
+
+
+@lru_cache(maxsize=4)
+def _plan_for(
+    configured_model: str,
+    endpoint: str,
+    capabilities: HardwareCapabilitySnapshot,
+    hardware_path: str,
+) -> _StartPlan:
+    """Build (and memoize) the immutable launch plan for one model/endpoint/hardware combo."""
+
+    parsed = urlparse(endpoint)
+    host = parsed.hostname or "127.0.0.1"
+    port = parsed.port or 8001
 
-    model, served_model_name = _resolve_launch_model(settings.ocr.model)
+    model, served_model_name = _resolve_launch_model(configured_model)
     command = [
         sys.executable,
         "-m",
@@ -524,6 +776,8 @@ def _build_start_plan(
         "--trust-remote-code",
         "--max-model-len",
         "8192",
+        # Every tile request carries the same OCR prompt, so its KV prefix is reusable.
+        "--enable-prefix-caching",
     ]
     if served_model_name and served_model_name != model:
         command.extend(["--served-model-name", served_model_name])
@@ -532,6 +786,10 @@ def _build_start_plan(
         tensor_parallel_size = max(1, capabilities.gpu_count)
         command.extend(["--tensor-parallel-size", str(tensor_parallel_size)])
         command.extend(["--gpu-memory-utilization", "0.90"])
+        numa_node = capabilities.gpu_numa_node
+        if numa_node is not None and shutil.which("numactl"):
+            # Keep the server's CPU threads and host buffers on the GPUs' socket.
+            command[:0] = ["numactl", f"--cpunodebind={numa_node}", f"--membind={numa_node}"]
     else:
         command.extend(["--device", "cpu"])
 
@@ -546,16 +804,45 @@ def _build_start_plan(
     )
 
 
-def _terminate_process(process: subprocess.Popen[str]) -> None:
-    if process.poll() is not None:
+def _wait_for_exit(pid: int, timeout_s: float) -> bool:
+    """Block up to ``timeout_s`` for ``pid`` to exit; pidfd-driven on Linux."""
+
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(pid)
+        except OSError:  # already gone
+            return True
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            return bool(poller.poll(int(timeout_s * 1000)))
+        finally:
+            os.close(pidfd)
+
+    deadline = time.monotonic() + timeout_s
+    while True:
+        try:
+            reaped, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:  # not our child, or reaped elsewhere
+            return True
+        if reaped:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+async def _terminate_process(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is not None:
         return
     try:
         process.terminate()
-        process.wait(timeout=5)
-    except subprocess.TimeoutExpired:
+        await asyncio.wait_for(process.wait(), timeout=5)
+    except asyncio.TimeoutError:
         process.kill()
-        process.wait(timeout=5)
-    except OSError:
+        await asyncio.wait_for(process.wait(), timeout=5)
+    except OSError:  # already reaped (ProcessLookupError)
         return
 
 
@@ -565,7 +852,7 @@ async def start_local_ocr_server(
     port: int = 8001,
     wait_for_ready: bool = True,
     ready_timeout: int = 300,
-) -> subprocess.Popen[str]:
+) -> asyncio.subprocess.Process:
     """Compatibility helper used by ad-hoc startup scripts."""
 
     cfg = get_settings()
@@ -583,11 +870,11 @@ async def start_local_ocr_server(
             capabilities=get_host_capabilities(),
             preferred_hardware_path=None,
         )
-        return subprocess.Popen(
-            list(plan.command),
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.STDOUT,
-            text=True,
+        return await asyncio.create_subprocess_exec(
+            *plan.command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            start_new_session=True,
         )
 
     local_cfg = replace(
@@ -631,10 +918,11 @@ def cli_start_server() -> None:
         print(f"PID: {process.pid}\n")
         print("Press Ctrl+C to stop.\n")
         try:
-            process.wait()
-        except KeyboardInterrupt:
+            await process.wait()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # asyncio.run surfaces Ctrl+C as a cancellation of this task.
             print("\nShutting down local OCR service...")
-            _terminate_process(process)
+            await _terminate_process(process)
             print("Server stopped.\n")
 
     asyncio.run(_main())
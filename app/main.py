@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import html
-import json
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, AsyncIterator, Mapping, cast
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.responses import (
     FileResponse,
@@ -26,6 +26,8 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from app import metrics
 from app.dom_links import blend_dom_with_ocr, demo_dom_links, demo_ocr_links, serialize_links
 from app.jobs import JobManager, JobSnapshot, JobState, build_signed_webhook_sender
+from app.local_ocr import close_local_ocr_clients
+from app.ocr_client import close_ocr_clients
 from app.schemas import (
     EmbeddingSearchRequest,
     EmbeddingSearchResponse,
@@ -74,6 +76,8 @@ async def _lifespan(_: FastAPI):
     yield
     # Gracefully stop the watchdog on shutdown
     await JOB_MANAGER.stop_watchdog()
+    await close_local_ocr_clients()
+    await close_ocr_clients()
 
 
 app = FastAPI(title="Markdown Web Browser", lifespan=_lifespan)
@@ -367,7 +371,7 @@ async def job_events(job_id: str, request: Request, since: str | None = None) ->
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                         "data": {"count": heartbeat},
                     }
-                    yield json.dumps(heartbeat_entry) + "\n"
+                    yield _json_dumps(heartbeat_entry) + "\n"
                 if await request.is_disconnected():
                     break
         finally:
@@ -507,6 +511,12 @@ async def delete_webhook(job_id: str, payload: WebhookDeleteRequest) -> dict[str
     return {"job_id": job_id, "deleted": deleted}
 
 
+def _json_dumps(value: Any) -> str:
+    """Serialize SSE/NDJSON payloads via orjson (C encoder, compact separators)."""
+
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 def _snapshot_events(snapshot: JobSnapshot) -> list[tuple[str, str]]:
     events: list[tuple[str, str]] = []
     state = snapshot.get("state")
@@ -523,21 +533,21 @@ def _snapshot_events(snapshot: JobSnapshot) -> list[tuple[str, str]]:
         events.append(("profile", str(profile_id)))
     manifest = snapshot.get("manifest")
     if manifest:
-        events.append(("manifest", json.dumps(manifest)))
+        events.append(("manifest", _json_dumps(manifest)))
         if isinstance(manifest, dict):
             warnings = manifest.get("warnings")
             if warnings:
-                events.append(("warnings", json.dumps(warnings)))
+                events.append(("warnings", _json_dumps(warnings)))
             blocklist_hits = manifest.get("blocklist_hits")
             if blocklist_hits:
-                events.append(("blocklist", json.dumps(blocklist_hits)))
+                events.append(("blocklist", _json_dumps(blocklist_hits)))
             sweep_stats = manifest.get("sweep_stats")
             overlap_ratio = manifest.get("overlap_match_ratio")
             if sweep_stats or overlap_ratio is not None:
                 events.append(
                     (
                         "sweep",
-                        json.dumps(
+                        _json_dumps(
                             {
                                 "sweep_stats": sweep_stats,
                                 "overlap_match_ratio": overlap_ratio,
@@ -547,7 +557,7 @@ def _snapshot_events(snapshot: JobSnapshot) -> list[tuple[str, str]]:
                 )
             validation_failures = manifest.get("validation_failures")
             if validation_failures:
-                events.append(("validation", json.dumps(validation_failures)))
+                events.append(("validation", _json_dumps(validation_failures)))
             dom_summary = None
             dom_assists = manifest.get("dom_assists")
             if isinstance(dom_assists, list) and dom_assists:
@@ -563,7 +573,7 @@ def _snapshot_events(snapshot: JobSnapshot) -> list[tuple[str, str]]:
                 elif raw_summary:
                     dom_summary = raw_summary
             if dom_summary:
-                events.append(("dom_assist", json.dumps(dom_summary)))
+                events.append(("dom_assist", _json_dumps(dom_summary)))
             environment = manifest.get("environment")
             if isinstance(environment, dict):
                 env_data = cast(dict[str, Any], environment)
@@ -572,7 +582,7 @@ def _snapshot_events(snapshot: JobSnapshot) -> list[tuple[str, str]]:
                 events.append(("runtime", f"{cft_label} · Playwright {playwright_version}"))
     artifacts = snapshot.get("artifacts")
     if artifacts:
-        events.append(("artifacts", json.dumps(artifacts)))
+        events.append(("artifacts", _json_dumps(artifacts)))
     error = snapshot.get("error")
     if error:
         events.append(("log", f'<li class="text-red-500">{error}</li>'))
@@ -582,7 +592,7 @@ def _snapshot_events(snapshot: JobSnapshot) -> list[tuple[str, str]]:
 def _serialize_log_entry(entry: dict[str, Any]) -> str:
     payload = entry.copy()
     payload.setdefault("event", "snapshot")
-    return json.dumps(payload)
+    return _json_dumps(payload)
 
 
 def _extract_sequence(entry: Mapping[str, Any]) -> int | None:
@@ -4,13 +4,26 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
-import base64
+import hashlib
 import logging
+import random
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Protocol, Sequence
+from datetime import date
+from functools import lru_cache
+from typing import Any, NamedTuple, Protocol, Sequence
 
 import httpx
+import orjson
+import zstandard as zstd
+
+try:  # SIMD (SSSE3/AVX2) base64 from the local-ocr extra; same API as the stdlib
+    import pybase64 as base64
+except ImportError:  # pragma: no cover - stdlib fallback
+    import base64  # type: ignore[no-redef]
 
 from app.hardware import HardwareCapabilitySnapshot, get_host_capabilities
 from app.local_ocr import ensure_local_ocr_service
@@ -29,13 +42,20 @@ from app.ocr_policy import (
     select_ocr_backend,
     should_reevaluate_policy,
 )
-from app.settings import Settings, get_settings, resolve_ocr_backend_defaults
+from app.settings import OCRSettings, Settings, get_settings, resolve_ocr_backend_defaults
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_ENDPOINT_SUFFIX = "/chat/completions"  # OpenAI-compatible endpoint
 REQUEST_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=30.0, pool=10.0)
-_BACKOFF_SCHEDULE = (3.0, 9.0)
-_MAX_ATTEMPTS = len(_BACKOFF_SCHEDULE) + 1
+_BACKOFF_BASE_S = 0.5
+_BACKOFF_CAP_S = 30.0
+_MAX_ATTEMPTS = 5
+# Client errors that may succeed on retry; any other 4xx fails the batch at once.
+_RETRYABLE_4XX = frozenset({408, 425, 429})
+# Above this many raw tile bytes, base64 encoding runs in a worker thread so a
+# large batch does not stall the event loop.
+_OFFLOAD_ENCODE_BYTES = 1_000_000
+_REQUEST_ZSTD_LEVEL = 3
 _QUOTA_WARNING_RATIO = 0.7
 _CPU_LATENCY_SPIKE_MS = 20_000
 _CIRCUIT_BREAKER_FAILURE_THRESHOLD = 2
@@ -52,6 +72,17 @@ GLM_DEFAULT_PROMPT = (
     "Recognize the text in the image and output in Markdown format. Preserve the original "
     "layout including headings, paragraphs, tables, and formulas."
 )
+# Payloads are serialized with this token in place of each tile's base64 and the
+# encoded bytes are spliced into the JSON afterwards (base64 never needs escaping).
+_IMAGE_PLACEHOLDER = "@@mdwb-tile-base64@@"
+# Submission clients are kept per event loop (httpx pools are loop-bound) and per
+# timeout profile + pool size, so HTTP/2 connections and TLS sessions survive
+# across calls.
+_HTTP_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[tuple[str, float | None], ...], httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
 @dataclass(slots=True, frozen=True)
 class OCRBackendRuntime:
     """Normalized OCR backend identity captured in manifests/telemetry."""
@@ -173,6 +204,13 @@ def build_glm_openai_chat_payload(
 def extract_glm_openai_markdown(response_json: dict[str, Any]) -> str:
     """Extract Markdown from OpenAI-compatible GLM OCR responses."""
 
+    markdown = _find_openai_markdown(response_json)
+    if markdown is None:
+        raise ValueError("GLM OpenAI response missing markdown/text content")
+    return markdown
+
+
+def _find_openai_markdown(response_json: dict[str, Any]) -> str | None:
     choices = response_json.get("choices")
     if isinstance(choices, list) and choices:
         first = choices[0]
@@ -189,7 +227,7 @@ def extract_glm_openai_markdown(response_json: dict[str, Any]) -> str:
         value = response_json.get(key)
         if isinstance(value, str) and value.strip():
             return value.strip()
-    raise ValueError("GLM OpenAI response missing markdown/text content")
+    return None
 
 
 def extract_glm_maas_markdown(response_json: dict[str, Any]) -> str:
@@ -337,16 +375,21 @@ class SubmitTilesResult:
     autotune: "OcrAutotuneSnapshot | None" = None
     reevaluate_policy: bool = False
     reevaluation_reason_code: str | None = None
+    cache_hits: int = 0
 
 
-@dataclass(slots=True)
-class _EncodedTile:
-    """Internal helper storing base64 payload + size metadata."""
+class _EncodedTile(NamedTuple):
+    """Internal helper storing base64 payload + size metadata.
+
+    A NamedTuple rather than a dataclass: one is built per tile and never mutated,
+    and tuple construction skips the Python-level ``__init__``.
+    """
 
     tile_id: str
-    image_b64: str
+    image_b64: bytes
     size_bytes: int
     model: str | None
+    tile_bytes: bytes = b""
 
 
 @dataclass(slots=True)
@@ -398,27 +441,40 @@ class OcrAutotuneSnapshot:
 
 
 class _QuotaTracker:
-    """Process-level tracker for hosted OCR quota consumption."""
+    """Process-level tracker for hosted OCR quota consumption.
+
+    ``record`` may be reached from worker threads as well as the event loop, so
+    the counter update is guarded by a (normally uncontended) lock.
+    """
 
     def __init__(self) -> None:
-        self._current_day: str | None = None
+        self._lock = threading.Lock()
+        self._current_day: int | None = None
         self._count: int = 0
         self._warned: bool = False
+        self._threshold_for: tuple[int, float] | None = None
+        self._threshold: int = 0
 
     def record(self, tiles: int, *, limit: int | None, ratio: float) -> OCRQuotaStatus:
-        today = time.strftime("%Y-%m-%d")
-        if self._current_day != today:
-            self._current_day = today
-            self._count = 0
-            self._warned = False
-        self._count += tiles
+        today = date.today().toordinal()
         warning = False
-        if limit and not self._warned and self._count >= int(limit * ratio):
-            warning = True
-            self._warned = True
+        with self._lock:
+            if self._current_day != today:
+                self._current_day = today
+                self._count = 0
+                self._warned = False
+            self._count += tiles
+            used = self._count
+            if limit and not self._warned:
+                if self._threshold_for != (limit, ratio):
+                    self._threshold_for = (limit, ratio)
+                    self._threshold = int(limit * ratio)
+                if used >= self._threshold:
+                    warning = True
+                    self._warned = True
         return OCRQuotaStatus(
             limit=limit,
-            used=self._count if limit else None,
+            used=used if limit else None,
             threshold_ratio=ratio,
             warning_triggered=warning,
         )
@@ -426,14 +482,42 @@ class _QuotaTracker:
     def reset(self) -> None:
         """Reset tracker (useful for tests)."""
 
-        self._current_day = None
-        self._count = 0
-        self._warned = False
+        with self._lock:
+            self._current_day = None
+            self._count = 0
+            self._warned = False
 
 
 _quota_tracker = _QuotaTracker()
 
 
+class _TileMarkdownCache:
+    """Process-level LRU of OCR Markdown keyed by (model, tile content digest)."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[str, bytes], str] = OrderedDict()
+
+    def get(self, key: tuple[str, bytes]) -> str | None:
+        markdown = self._entries.get(key)
+        if markdown is not None:
+            self._entries.move_to_end(key)
+        return markdown
+
+    def put(self, key: tuple[str, bytes], markdown: str, *, max_entries: int) -> None:
+        self._entries[key] = markdown
+        self._entries.move_to_end(key)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def reset(self) -> None:
+        """Drop all cached entries (useful for tests)."""
+
+        self._entries.clear()
+
+
+_tile_cache = _TileMarkdownCache()
+
+
 class _CircuitBreaker:
     """Simple per-backend circuit breaker with failure threshold + cooldown."""
 
@@ -603,8 +687,18 @@ def resolve_ocr_backend(
 
     cfg = settings or get_settings()
     capability_snapshot = capabilities or get_host_capabilities()
+    return _resolve_ocr_backend_cached(cfg.ocr, capability_snapshot.preferred_hardware_path)
+
+
+# The decision depends only on the (frozen, hashable) OCR settings and the host's
+# preferred local hardware path, which change rarely but are resolved on every
+# capture; a settings reload produces a new key, so no explicit invalidation.
+@lru_cache(maxsize=64)
+def _resolve_ocr_backend_cached(
+    ocr_settings: OCRSettings, preferred_local_hardware: str
+) -> OCRBackendRuntime:
     backend_id, backend_mode, hardware_path, fallback_chain, provider = (
-        resolve_ocr_backend_defaults(cfg.ocr)
+        resolve_ocr_backend_defaults(ocr_settings)
     )
     ordered_ids = [backend_id, *fallback_chain]
     deduped_ids: list[str] = []
@@ -619,7 +713,7 @@ def resolve_ocr_backend(
         candidate_hardware = _hardware_path_for_candidate(
             candidate_id,
             default_hardware_path=hardware_path,
-            preferred_local_hardware=capability_snapshot.preferred_hardware_path,
+            preferred_local_hardware=preferred_local_hardware,
         )
         policy_candidates.append(
             OCRBackendCandidate(
@@ -724,8 +818,9 @@ async def healthcheck_ocr_backend(
             local_service=probe.local_service,
         )
     request_timeout = _resolve_request_timeout(backend=probe.backend)
-    owns_client = client is None
-    http_client = client or httpx.AsyncClient(timeout=request_timeout, http2=True)
+    http_client = client or _get_http_client(
+        request_timeout, max_connections=cfg.ocr.max_concurrency
+    )
     headers: dict[str, str] = {}
     if cfg.ocr.api_key and not cfg.ocr.local_url:
         headers["Authorization"] = f"Bearer {cfg.ocr.api_key}"
@@ -749,9 +844,6 @@ async def healthcheck_ocr_backend(
     except Exception as exc:  # pragma: no cover - network dependent
         reason_code = "network-error"
         detail = str(exc)
-    finally:
-        if owns_client:
-            await http_client.aclose()
     return OCRBackendHealth(
         backend=probe.backend,
         healthy=healthy,
@@ -787,6 +879,34 @@ async def submit_tiles(
             local_service=None,
         )
 
+    # Identical tiles (repeated headers/footers, re-sent regions) are submitted
+    # once per call, and ones already in the content cache are not sent at all.
+    cache_limit = cfg.ocr.cache_max_entries
+    cache_keys = [_tile_cache_key(req, cfg) for req in requests]
+    cached_chunks: dict[tuple[str, bytes], str] = {}
+    unique_requests: dict[tuple[str, bytes], OCRRequest] = {}
+    for req, key in zip(requests, cache_keys, strict=True):
+        if key in cached_chunks or key in unique_requests:
+            continue
+        hit = _tile_cache.get(key) if cache_limit > 0 else None
+        if hit is not None:
+            cached_chunks[key] = hit
+        else:
+            unique_requests[key] = req
+    cache_hits = sum(1 for key in cache_keys if key in cached_chunks)
+    if not unique_requests:
+        return SubmitTilesResult(
+            markdown_chunks=[cached_chunks[key] for key in cache_keys],
+            batches=[],
+            quota=_quota_tracker.record(
+                0, limit=cfg.ocr.daily_quota_tiles, ratio=_QUOTA_WARNING_RATIO
+            ),
+            backend=backend,
+            host_capabilities=capabilities_snapshot.to_dict(),
+            local_service=None,
+            cache_hits=cache_hits,
+        )
+
     failover_events: list[OCRFailoverEvent] = []
     chain = list(backend.fallback_chain)
     if not chain:
@@ -861,7 +981,7 @@ async def submit_tiles(
 
         try:
             result = await _submit_tiles_single_backend(
-                requests=requests,
+                requests=list(unique_requests.values()),
                 settings=cfg,
                 capabilities=capabilities_snapshot,
                 backend=candidate,
@@ -905,6 +1025,14 @@ async def submit_tiles(
                 )
             )
         result.failover_events = failover_events
+        _merge_chunks(
+            result,
+            cache_keys,
+            cached_chunks,
+            tuple(unique_requests),
+            max_entries=cache_limit,
+        )
+        result.cache_hits = cache_hits
         return result
 
     if last_error is None:
@@ -933,21 +1061,23 @@ async def _submit_tiles_single_backend(
     server_url = _select_server_url(settings, backend=backend)
     endpoint = _normalize_endpoint(server_url, backend_mode=backend.backend_mode)
 
-    headers = {"Content-Type": "application/json"}
-    if settings.ocr.api_key and not backend.backend_id.endswith("-local-openai"):
-        headers["Authorization"] = f"Bearer {settings.ocr.api_key}"
-
-    request_timeout = _resolve_request_timeout(backend=backend)
-    owns_client = client is None
-    http_client = client or httpx.AsyncClient(timeout=request_timeout, http2=True)
+    headers = _submit_headers(
+        None if backend.backend_id.endswith("-local-openai") else settings.ocr.api_key
+    )
 
     min_limit, max_limit, _ = _resolve_runtime_concurrency_limits(
         settings=settings,
         backend=backend,
         capabilities=capabilities,
     )
+    request_timeout = _resolve_request_timeout(backend=backend)
+    http_client = client or _get_http_client(request_timeout, max_connections=max_limit)
     limiter = _AdaptiveLimiter(_AutotuneController(min_limit=min_limit, max_limit=max_limit))
-    encoded_tiles = [_encode_request(req, settings) for req in requests]
+    binary_upload = settings.ocr.binary_upload and backend.backend_id.endswith("-local-openai")
+    if not binary_upload and sum(len(req.tile_bytes) for req in requests) > _OFFLOAD_ENCODE_BYTES:
+        encoded_tiles = await asyncio.to_thread(_encode_requests, requests, settings, binary_upload)
+    else:
+        encoded_tiles = _encode_requests(requests, settings, binary_upload)
 
     max_batch_tiles = (
         1
@@ -961,7 +1091,9 @@ async def _submit_tiles_single_backend(
     )
 
     telemetry: list[OCRBatchTelemetry] = []
-    markdown_by_id: dict[str, str] = {req.tile_id: "" for req in requests}
+    # Batches return chunks in tile order; write them straight into request order.
+    position_by_id = {tile.tile_id: idx for idx, tile in enumerate(encoded_tiles)}
+    markdown_chunks = [""] * len(encoded_tiles)
 
     async def _submit(group: list[_EncodedTile]) -> None:
         async with limiter.slot():
@@ -973,17 +1105,31 @@ async def _submit_tiles_single_backend(
                 use_fp8=settings.ocr.use_fp8,
                 backend_mode=backend.backend_mode,
                 backend_id=backend.backend_id,
+                binary_upload=binary_upload,
+                zstd_min_bytes=settings.ocr.request_zstd_min_bytes,
             )
         telemetry.append(batch_result.telemetry)
         for tile_id, chunk in zip(batch_result.tile_ids, batch_result.markdown, strict=True):
-            markdown_by_id[tile_id] = chunk
+            markdown_chunks[position_by_id[tile_id]] = chunk
         await limiter.record(batch_result.telemetry)
 
+    # A fixed pool of ``max_limit`` workers drains the batch list, so only as many
+    # coroutines exist as could ever hold a limiter slot at once. The TaskGroup
+    # cancels in-flight siblings as soon as one batch fails, instead of leaving
+    # them posting tiles for a backend the caller is about to fail over from.
+    pending = iter(batches)
+
+    async def _worker() -> None:
+        for group in pending:
+            await _submit(group)
+
     try:
-        await asyncio.gather(*(_submit(group) for group in batches))
-    finally:
-        if owns_client:
-            await http_client.aclose()
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(min(max_limit, len(batches))):
+                workers.create_task(_worker())
+    except ExceptionGroup as errors:
+        # Callers classify the concrete HTTP/runtime error for failover.
+        raise errors.exceptions[0]
 
     quota_status = _quota_tracker.record(
         len(requests), limit=settings.ocr.daily_quota_tiles, ratio=_QUOTA_WARNING_RATIO
@@ -1002,7 +1148,6 @@ async def _submit_tiles_single_backend(
         )
         autotune_snapshot.policy_flap_suppression_count = policy_state.flap_suppression_count
         autotune_snapshot.policy_switch_count_window = len(policy_state.switch_timestamps)
-    markdown_chunks = [markdown_by_id[tile.tile_id] for tile in encoded_tiles]
     return SubmitTilesResult(
         markdown_chunks=markdown_chunks,
         batches=telemetry,
@@ -1016,6 +1161,76 @@ async def _submit_tiles_single_backend(
     )
 
 
+@lru_cache(maxsize=8)
+def _submit_headers(api_key: str | None) -> dict[str, str]:
+    """Return the shared (read-only) submission headers for ``api_key``."""
+
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    return headers
+
+
+def _get_http_client(timeout: httpx.Timeout, *, max_connections: int) -> httpx.AsyncClient:
+    clients = _HTTP_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    key = (*sorted(timeout.as_dict().items()), ("max_connections", max_connections))
+    http_client = clients.get(key)
+    if http_client is None or http_client.is_closed:
+        # Pool sized to the batch concurrency ceiling: under HTTP/2 concurrent
+        # batches multiplex over a few connections; on an HTTP/1.1 fallback every
+        # in-flight batch still gets a kept-alive connection.
+        http_client = httpx.AsyncClient(
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=60.0,
+            ),
+        )
+        clients[key] = http_client
+    return http_client
+
+
+async def close_ocr_clients() -> None:
+    """Close the keep-alive OCR submission clients owned by the running loop."""
+
+    clients = _HTTP_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for http_client in clients.values():
+        await http_client.aclose()
+
+
+def _tile_cache_key(request: OCRRequest, settings: Settings) -> tuple[str, bytes]:
+    digest = hashlib.blake2b(request.tile_bytes, digest_size=16).digest()
+    return request.model or settings.ocr.model, digest
+
+
+def _merge_chunks(
+    result: SubmitTilesResult,
+    cache_keys: Sequence[tuple[str, bytes]],
+    cached_chunks: dict[tuple[str, bytes], str],
+    submitted_keys: Sequence[tuple[str, bytes]],
+    *,
+    max_entries: int,
+) -> None:
+    """Fan submitted + cached chunks back out to every request (in request order)."""
+
+    fresh = dict(zip(submitted_keys, result.markdown_chunks, strict=True))
+    if max_entries > 0:
+        for key, chunk in fresh.items():
+            if chunk:
+                _tile_cache.put(key, chunk, max_entries=max_entries)
+    result.markdown_chunks = [
+        cached_chunks[key] if key in cached_chunks else fresh[key] for key in cache_keys
+    ]
+
+
+def reset_tile_cache() -> None:
+    """Clear the tile Markdown cache (exposed for testability)."""
+
+    _tile_cache.reset()
+
+
 def reset_quota_tracker() -> None:
     """Reset quota accounting (exposed for testability)."""
 
@@ -1050,6 +1265,8 @@ async def _submit_batch(
     use_fp8: bool,
     backend_mode: str,
     backend_id: str,
+    binary_upload: bool = False,
+    zstd_min_bytes: int = 0,
 ) -> _BatchResult:
     payload_bytes = sum(tile.size_bytes for tile in tiles) + 2048
     attempts = 0
@@ -1059,23 +1276,50 @@ async def _submit_batch(
     tile_ids = tuple(tile.tile_id for tile in tiles)
     model_aliases = _model_alias_candidates(tiles[0].model or "", backend_id=backend_id)
     model_alias_index = 0
+    # Serialize once per model alias: plain retries resend the same bytes, and
+    # only an alias fallback changes the payload.
+    body_alias_index = -1
+    body = b""
+    body_headers = headers
     while attempts < _MAX_ATTEMPTS:
         attempts += 1
         model_override = model_aliases[model_alias_index] if model_aliases else None
-        payload = _build_payload(
-            tiles,
-            use_fp8=use_fp8,
-            backend_mode=backend_mode,
-            backend_id=backend_id,
-            model_override=model_override,
-        )
+        if not binary_upload and body_alias_index != model_alias_index:
+            body = _serialize_payload(
+                tiles,
+                use_fp8=use_fp8,
+                backend_mode=backend_mode,
+                backend_id=backend_id,
+                model_override=model_override,
+            )
+            body_alias_index = model_alias_index
+            body_headers = headers
+            if zstd_min_bytes > 0 and len(body) >= zstd_min_bytes:
+                body = (
+                    await asyncio.to_thread(_zstd_compress, body)
+                    if len(body) > _OFFLOAD_ENCODE_BYTES
+                    else _zstd_compress(body)
+                )
+                body_headers = {**headers, "Content-Encoding": "zstd"}
         start = time.perf_counter()
         try:
-            response = await http_client.post(endpoint, headers=headers, json=payload)
+            if binary_upload:
+                response = await _post_multipart(
+                    tiles,
+                    endpoint=endpoint,
+                    headers=headers,
+                    http_client=http_client,
+                    model=model_override or tiles[0].model or "",
+                    use_fp8=use_fp8,
+                )
+            else:
+                response = await http_client.post(endpoint, headers=body_headers, content=body)
             status_code = response.status_code
             response.raise_for_status()
-            data = response.json()
-            markdown = _extract_markdown_batch(data, tile_ids, backend_mode=backend_mode)
+            data = orjson.loads(response.content)
+            markdown = _extract_markdown_batch(
+                data, tile_ids, backend_mode=backend_mode, endpoint=endpoint
+            )
             latency_ms = int((time.perf_counter() - start) * 1000)
             request_id = _extract_request_id(response, data)
             telemetry = OCRBatchTelemetry(
@@ -1116,6 +1360,8 @@ async def _submit_batch(
                 attempts,
                 _MAX_ATTEMPTS,
             )
+            if status_code < 500 and status_code not in _RETRYABLE_4XX:
+                break
         except Exception as exc:
             last_error = exc
             LOGGER.warning(
@@ -1127,12 +1373,68 @@ async def _submit_batch(
             )
         if attempts >= _MAX_ATTEMPTS:
             break
-        await _sleep(_BACKOFF_SCHEDULE[attempts - 1])
+        await _sleep(_backoff_delay(attempts))
     raise RuntimeError(
-        f"OCR request failed after {_MAX_ATTEMPTS} attempts (mode={backend_mode})"
+        f"OCR request failed after {attempts} attempt(s) (mode={backend_mode})"
     ) from last_error
 
 
+async def _post_multipart(
+    tiles: Sequence[_EncodedTile],
+    *,
+    endpoint: str,
+    headers: dict[str, str],
+    http_client: httpx.AsyncClient,
+    model: str,
+    use_fp8: bool,
+) -> httpx.Response:
+    """Upload raw tile images as ``multipart/form-data`` (no base64 inflation)."""
+
+    # httpx derives the multipart boundary header itself.
+    multipart_headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+    files = [
+        (f"tile_{idx}", (tile.tile_id, tile.tile_bytes, "image/png"))
+        for idx, tile in enumerate(tiles)
+    ]
+    data = {"model": model, "fp8": str(use_fp8).lower()}
+    return await http_client.post(endpoint, headers=multipart_headers, files=files, data=data)
+
+
+def _serialize_payload(
+    tiles: Sequence[_EncodedTile],
+    *,
+    use_fp8: bool,
+    backend_mode: str,
+    backend_id: str,
+    model_override: str | None = None,
+) -> bytes:
+    """Return the JSON request body with each tile's base64 bytes spliced in."""
+
+    payload = _build_payload(
+        tiles,
+        use_fp8=use_fp8,
+        backend_mode=backend_mode,
+        backend_id=backend_id,
+        model_override=model_override,
+    )
+    # Tile images follow the prompt and appear in tile order, so the fragments
+    # between placeholders line up with ``tiles``.
+    fragments = orjson.dumps(payload).split(_IMAGE_PLACEHOLDER.encode("ascii"))
+    if len(fragments) != len(tiles) + 1:
+        raise ValueError("OCR payload placeholder count does not match tile count")
+    parts = [fragments[0]]
+    for tile, fragment in zip(tiles, fragments[1:], strict=True):
+        parts.append(tile.image_b64)
+        parts.append(fragment)
+    return b"".join(parts)
+
+
+def _zstd_compress(body: bytes) -> bytes:
+    # Compressor objects are not thread-safe and this may run in a worker
+    # thread, so each body gets its own.
+    return zstd.ZstdCompressor(level=_REQUEST_ZSTD_LEVEL).compress(body)
+
+
 def _build_payload(
     tiles: Sequence[_EncodedTile],
     *,
@@ -1149,7 +1451,7 @@ def _build_payload(
             raise ValueError("GLM MaaS requests must contain exactly one tile")
         tile = tiles[0]
         model = model_override or tile.model or GLM_MAAS_DEFAULT_MODEL
-        return build_glm_maas_payload(file_ref=tile.image_b64, model=model)
+        return build_glm_maas_payload(file_ref=_IMAGE_PLACEHOLDER, model=model)
 
     # OpenAI-compatible vision format with multiple images in content array
     # Add allenai/ prefix if not present (for DeepInfra)
@@ -1181,11 +1483,10 @@ def _build_payload(
         }
     ]
 
-    # Add all tile images
-    for tile in tiles:
-        content.append(
-            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{tile.image_b64}"}}
-        )
+    # Add all tile images; _serialize_payload swaps in the base64 bytes.
+    image_url = f"data:image/png;base64,{_IMAGE_PLACEHOLDER}"
+    for _ in tiles:
+        content.append({"type": "image_url", "image_url": {"url": image_url}})
 
     return {
         "model": model,
@@ -1195,9 +1496,31 @@ def _build_payload(
     }
 
 
-def _encode_request(request: OCRRequest, settings: Settings) -> _EncodedTile:
-    image_b64 = base64.b64encode(request.tile_bytes).decode("ascii")
+def _encode_requests(
+    requests: Sequence[OCRRequest],
+    settings: Settings,
+    binary: bool,
+) -> list[_EncodedTile]:
+    return [_encode_request(req, settings, binary=binary) for req in requests]
+
+
+def _encode_request(
+    request: OCRRequest,
+    settings: Settings,
+    *,
+    binary: bool = False,
+) -> _EncodedTile:
     model = request.model or settings.ocr.model
+    if binary:
+        return _EncodedTile(
+            tile_id=request.tile_id,
+            image_b64=b"",
+            size_bytes=len(request.tile_bytes),
+            model=model,
+            tile_bytes=request.tile_bytes,
+        )
+    # Kept as ASCII bytes: the JSON body splices them in without a str round-trip.
+    image_b64 = base64.b64encode(memoryview(request.tile_bytes))
     return _EncodedTile(
         tile_id=request.tile_id,
         image_b64=image_b64,
@@ -1207,48 +1530,52 @@ def _encode_request(request: OCRRequest, settings: Settings) -> _EncodedTile:
 
 
 def _group_tiles(
-    tiles: Sequence[_EncodedTile],
+    tiles: list[_EncodedTile],
     *,
     max_tiles: int,
     max_bytes: int,
 ) -> list[list[_EncodedTile]]:
+    # Single pass over parallel size/model columns; each group is one slice of
+    # ``tiles`` taken when it flushes. A group flushes only when the next tile would
+    # overflow it, so a full (or single oversized) group closes on the next tile.
+    sizes = [tile.size_bytes for tile in tiles]
+    models = [tile.model for tile in tiles]
     groups: list[list[_EncodedTile]] = []
-    current: list[_EncodedTile] = []
-    current_bytes = 0
-    current_model: str | None = None
-
-    for tile in tiles:
-        tile_bytes = tile.size_bytes
-        flush = False
-        if current and len(current) >= max_tiles:
-            flush = True
-        if current and current_bytes + tile_bytes > max_bytes:
-            flush = True
-        if current and current_model and tile.model != current_model:
-            flush = True
-        if flush:
-            groups.append(current[:])
-            current = []
-            current_bytes = 0
-            current_model = None
-        current.append(tile)
-        current_bytes += tile_bytes
-        current_model = current_model or tile.model
-        if current_bytes >= max_bytes:
-            groups.append(current[:])
-            current = []
-            current_bytes = 0
-            current_model = None
-    if current:
-        groups.append(current)
+    start = 0
+    acc_bytes = 0
+    acc_model: str | None = None
+
+    for idx in range(len(tiles)):
+        size = sizes[idx]
+        model = models[idx]
+        if idx > start and (
+            idx - start >= max_tiles
+            or acc_bytes + size > max_bytes
+            or (acc_model and model != acc_model)
+        ):
+            groups.append(tiles[start:idx])
+            start = idx
+            acc_bytes = 0
+            acc_model = None
+        acc_bytes += size
+        acc_model = acc_model or model
+    if start < len(tiles):
+        groups.append(tiles[start:])
     return groups
 
 
+# Response shape ("openai" | "results" | "data" | "single") last seen per endpoint.
+# A backend answers in one shape, so later batches go straight to that extractor
+# and only fall back to full detection when the shape stops matching.
+_RESPONSE_SHAPES: dict[str, str] = {}
+
+
 def _extract_markdown_batch(
     response_json: dict,
     tile_ids: Sequence[str],
     *,
     backend_mode: str,
+    endpoint: str | None = None,
 ) -> list[str]:
     """Normalize various olmOCR response formats with multi-input support."""
 
@@ -1260,35 +1587,68 @@ def _extract_markdown_batch(
             raise ValueError("GLM MaaS response requires exactly one tile id")
         return [extract_glm_maas_markdown(response_json)]
 
-    # OpenAI-compatible format: {"choices": [{"message": {"content": "..."}}]}
-    try:
-        openai_chunk = extract_glm_openai_markdown(response_json)
-    except ValueError:
-        openai_chunk = None
-    if openai_chunk is not None:
-        if len(tile_ids) != 1:
-            raise ValueError("OpenAI-compatible responses require exactly one tile id")
-        return [openai_chunk]
+    if endpoint is not None:
+        shape = _RESPONSE_SHAPES.get(endpoint)
+        if shape is not None:
+            chunks = _extract_with_shape(shape, response_json, tile_ids)
+            if chunks is not None:
+                return chunks
+
+    shape, chunks = _detect_markdown_batch(response_json, tile_ids)
+    if endpoint is not None:
+        _RESPONSE_SHAPES[endpoint] = shape
+    return chunks
 
-    def _extract_from_entry(entry: dict) -> str | None:
-        if not isinstance(entry, dict):
+
+def _extract_with_shape(
+    shape: str,
+    response_json: dict,
+    tile_ids: Sequence[str],
+) -> list[str] | None:
+    """Extract using a known response shape; ``None`` means the shape did not match."""
+
+    if shape == "openai":
+        if len(tile_ids) != 1:
+            return None
+        chunk = _find_openai_markdown(response_json)
+        return [chunk] if chunk is not None else None
+    if shape == "single":
+        if len(tile_ids) != 1:
             return None
-        if "markdown" in entry:
-            return str(entry["markdown"])
-        if "content" in entry:
-            return str(entry["content"])
-        if "text" in entry:
-            return str(entry["text"])
+        chunk = _extract_from_entry(response_json)
+        return [chunk] if chunk is not None else None
+    source = response_json.get(shape)
+    if not isinstance(source, list) or len(source) < len(tile_ids):
+        return None
+    chunks = [_extract_from_entry(entry) for entry in source[: len(tile_ids)]]
+    if None in chunks:
         return None
+    return chunks  # type: ignore[return-value]
+
+
+def _detect_markdown_batch(
+    response_json: dict,
+    tile_ids: Sequence[str],
+) -> tuple[str, list[str]]:
+    # OpenAI-compatible format: {"choices": [{"message": {"content": "..."}}]}. This
+    # also covers single-tile responses with a top-level markdown/content/text
+    # string, so those return here without raising or walking results/data.
+    openai_chunk = _find_openai_markdown(response_json)
+    if openai_chunk is not None:
+        if len(tile_ids) != 1:
+            raise ValueError("OpenAI-compatible responses require exactly one tile id")
+        return "openai", [openai_chunk]
 
     buckets: list[str] = []
     results = response_json.get("results")
     data_entries = response_json.get("data")
     source = None
+    shape = "results"
     if isinstance(results, list) and len(results) >= len(tile_ids):
         source = results
     elif isinstance(data_entries, list) and len(data_entries) >= len(tile_ids):
         source = data_entries
+        shape = "data"
 
     if source is not None:
         for idx, tile_id in enumerate(tile_ids):
@@ -1297,16 +1657,28 @@ def _extract_markdown_batch(
             if chunk is None:
                 raise ValueError(f"OCR response missing markdown content for tile {tile_id}")
             buckets.append(chunk)
-        return buckets
+        return shape, buckets
 
     # Single-field fallback for older endpoints
     single = _extract_from_entry(response_json)
     if single is not None and len(tile_ids) == 1:
-        return [single]
+        return "single", [single]
 
     raise ValueError("OCR response missing markdown content for batch")
 
 
+def _extract_from_entry(entry: dict) -> str | None:
+    if not isinstance(entry, dict):
+        return None
+    if "markdown" in entry:
+        return str(entry["markdown"])
+    if "content" in entry:
+        return str(entry["content"])
+    if "text" in entry:
+        return str(entry["text"])
+    return None
+
+
 def _extract_request_id(response: httpx.Response, payload: dict) -> str | None:
     header_id = response.headers.get("x-request-id") or response.headers.get("X-Request-ID")
     if header_id:
@@ -1400,6 +1772,16 @@ async def _sleep(delay: float) -> None:
     await asyncio.sleep(delay)
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Capped exponential backoff for retry ``attempt`` (1-based) with ±50% jitter.
+
+    The jitter decorrelates retries from concurrent batches so they do not hit a
+    recovering endpoint in lockstep.
+    """
+
+    return min(_BACKOFF_CAP_S, _BACKOFF_BASE_S * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+
 def _resolve_runtime_concurrency_limits(
     *,
     settings: Settings,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field, replace
 from enum import Enum
 
@@ -20,6 +21,12 @@ REASON_REEVAL_NOT_REQUIRED = "policy.reeval.not-required"
 REASON_REEVAL_SUPPRESSED_COOLDOWN = "policy.reeval.suppressed.cooldown"
 REASON_REEVAL_SUPPRESSED_FLAPPING = "policy.reeval.suppressed.flapping"
 
+# Upper bound on remembered switch timestamps. Flap detection only compares the
+# window count against a small threshold, but hard failures bypass the cooldown
+# and a non-positive flap window disables pruning, so without a cap the history
+# would grow for the life of the process.
+_MAX_SWITCH_HISTORY = 32
+
 
 @dataclass(slots=True, frozen=True)
 class OCRBackendCandidate:
@@ -61,6 +68,12 @@ class OCRRuntimeSignal(str, Enum):
     NO_CHANGE = "no_change"
 
 
+# Signals that always trigger re-selection and bypass anti-flap suppression.
+_HARD_FAILURE_SIGNALS = frozenset(
+    {OCRRuntimeSignal.REQUEST_FAILED, OCRRuntimeSignal.BACKEND_UNHEALTHY}
+)
+
+
 @dataclass(slots=True, frozen=True)
 class OCRHysteresisSettings:
     """Default anti-flap controls for runtime policy switching."""
@@ -103,22 +116,23 @@ class OCRReevaluationDecision:
 def select_ocr_backend(inputs: OCRPolicyInputs) -> OCRPolicyDecision:
     """Select the best backend using explicit GPU/CPU/remote priorities."""
 
-    candidates = list(inputs.candidates)
+    candidates = inputs.candidates
     if not candidates:
         raise ValueError("OCR policy requires at least one backend candidate")
 
     reason_codes: list[str] = []
-    selected: OCRBackendCandidate | None = None
-    for candidate in candidates:
+    selected_idx: int | None = None
+    for idx, candidate in enumerate(candidates):
         if candidate.healthy is False:
             reason_codes.append(REASON_SKIP_UNHEALTHY)
             continue
-        selected = candidate
+        selected_idx = idx
         break
 
-    if selected is None:
-        selected = candidates[0]
+    if selected_idx is None:
+        selected_idx = 0
         reason_codes.append(REASON_SKIP_UNHEALTHY)
+    selected = candidates[selected_idx]
 
     if selected.hardware_path == "gpu":
         reason_codes.append(REASON_LOCAL_GPU_PREFERRED)
@@ -127,11 +141,10 @@ def select_ocr_backend(inputs: OCRPolicyInputs) -> OCRPolicyDecision:
     else:
         reason_codes.append(REASON_REMOTE_FALLBACK)
 
-    fallback_chain = tuple(
-        candidate.backend_id
-        for candidate in candidates
-        if candidate.backend_id != selected.backend_id
-    )
+    # Candidate ids are unique (the caller dedupes them), so the fallback chain is
+    # every candidate except the one picked above, in priority order.
+    backend_ids = tuple(candidate.backend_id for candidate in candidates)
+    fallback_chain = backend_ids[:selected_idx] + backend_ids[selected_idx + 1 :]
     # Re-evaluate faster when not on the top-tier local GPU path.
     reevaluate_after_s = 30 if selected.hardware_path != "gpu" else 120
 
@@ -172,7 +185,7 @@ def should_reevaluate_policy(
     if not base_should:
         return OCRReevaluationDecision(False, REASON_REEVAL_NOT_REQUIRED, state=state)
 
-    hard_failure = signal in {OCRRuntimeSignal.REQUEST_FAILED, OCRRuntimeSignal.BACKEND_UNHEALTHY}
+    hard_failure = signal in _HARD_FAILURE_SIGNALS
     flap_window_count = len(state.switch_timestamps)
     cooldown_remaining = _cooldown_remaining_seconds(
         state=state,
@@ -223,7 +236,7 @@ def should_reevaluate_policy(
 def _base_reevaluation_reason(
     *, signal: OCRRuntimeSignal, decision: OCRPolicyDecision
 ) -> tuple[str, bool]:
-    if signal in {OCRRuntimeSignal.REQUEST_FAILED, OCRRuntimeSignal.BACKEND_UNHEALTHY}:
+    if signal in _HARD_FAILURE_SIGNALS:
         return REASON_REEVAL_FAILURE, True
     if signal == OCRRuntimeSignal.BACKEND_RECOVERED:
         return REASON_REEVAL_RECOVERED, True
@@ -242,11 +255,13 @@ def _prune_runtime_state(
 ) -> OCRPolicyRuntimeState:
     if flap_window_seconds <= 0 or not state.switch_timestamps:
         return state
+    # Switch timestamps are appended in time order, so the expired prefix ends
+    # at the first entry >= cutoff.
     cutoff = now_ts - float(flap_window_seconds)
-    filtered = tuple(ts for ts in state.switch_timestamps if ts >= cutoff)
-    if filtered == state.switch_timestamps:
+    idx = bisect_left(state.switch_timestamps, cutoff)
+    if idx == 0:
         return state
-    return replace(state, switch_timestamps=filtered)
+    return replace(state, switch_timestamps=state.switch_timestamps[idx:])
 
 
 def _record_switch(
@@ -263,7 +278,7 @@ def _record_switch(
     return replace(
         next_state,
         last_switch_ts=now_ts,
-        switch_timestamps=(*next_state.switch_timestamps, now_ts),
+        switch_timestamps=(*next_state.switch_timestamps[1 - _MAX_SWITCH_HISTORY :], now_ts),
     )
 
 
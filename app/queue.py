@@ -107,6 +107,7 @@ async def process_capture_job(
         capture_result, _artifacts = await execute_capture_job(
             job_id=job_id,
             url=url,
+            store=ctx["store"],
             config=config,
         )
 
@@ -374,11 +375,21 @@ def create_arq_worker(
 # Worker lifecycle callbacks
 async def worker_startup(ctx: Dict[str, Any]) -> None:
     """Called when worker starts."""
+    from app.store import build_store
+
+    # One Store (and SQLite engine) per worker, shared by every capture job.
+    ctx["store"] = build_store()
     LOGGER.info("Arq worker started")
 
 
 async def worker_shutdown(ctx: Dict[str, Any]) -> None:
     """Called when worker shuts down."""
+    from app.local_ocr import close_local_ocr_clients
+    from app.ocr_client import close_ocr_clients
+
+    # Jobs run submit_tiles on this loop, so its keep-alive OCR clients live here.
+    await close_local_ocr_clients()
+    await close_ocr_clients()
     LOGGER.info("Arq worker shutdown")
 
 
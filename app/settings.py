@@ -25,6 +25,7 @@ __all__ = [
     "resolve_ocr_backend_defaults",
     "load_config",
     "get_settings",
+    "reset_settings_cache",
 ]
 
 
@@ -63,12 +64,16 @@ class OCRSettings:
     local_startup_timeout_s: int
     local_healthcheck_timeout_s: int
     local_max_restarts: int
+    local_health_cache_s: float
     use_fp8: bool
+    binary_upload: bool
+    request_zstd_min_bytes: int
     min_concurrency: int
     max_concurrency: int
     max_batch_tiles: int
     max_batch_bytes: int
     daily_quota_tiles: int | None
+    cache_max_entries: int
 
 
 @dataclass(frozen=True, slots=True)
@@ -352,12 +357,16 @@ def get_settings(env_path: str = ".env") -> Settings:
         local_startup_timeout_s=_int(cfg, "OCR_LOCAL_STARTUP_TIMEOUT_S", default=180),
         local_healthcheck_timeout_s=_int(cfg, "OCR_LOCAL_HEALTHCHECK_TIMEOUT_S", default=5),
         local_max_restarts=_int(cfg, "OCR_LOCAL_MAX_RESTARTS", default=1),
+        local_health_cache_s=_float(cfg, "OCR_LOCAL_HEALTH_CACHE_S", default=2.0),
         use_fp8=_bool(cfg, "OCR_USE_FP8", default=True),
+        binary_upload=_bool(cfg, "OCR_BINARY_UPLOAD", default=False),
+        request_zstd_min_bytes=_int(cfg, "OCR_REQUEST_ZSTD_MIN_BYTES", default=0),
         min_concurrency=_int(cfg, "OCR_MIN_CONCURRENCY", default=2),
         max_concurrency=_int(cfg, "OCR_MAX_CONCURRENCY", default=8),
         max_batch_tiles=_int(cfg, "OCR_MAX_BATCH_TILES", default=3),
         max_batch_bytes=_int(cfg, "OCR_MAX_BATCH_BYTES", default=25_000_000),
         daily_quota_tiles=_optional_int(cfg, "OCR_DAILY_QUOTA_TILES"),
+        cache_max_entries=_int(cfg, "OCR_CACHE_MAX_ENTRIES", default=256),
     )
     if ocr.max_concurrency < ocr.min_concurrency:
         msg = "OCR_MAX_CONCURRENCY must be >= OCR_MIN_CONCURRENCY"
@@ -371,6 +380,12 @@ def get_settings(env_path: str = ".env") -> Settings:
     if ocr.local_max_restarts < 0:
         msg = "OCR_LOCAL_MAX_RESTARTS must be >= 0"
         raise ValueError(msg)
+    if ocr.local_health_cache_s < 0:
+        msg = "OCR_LOCAL_HEALTH_CACHE_S must be >= 0"
+        raise ValueError(msg)
+    if ocr.cache_max_entries < 0:
+        msg = "OCR_CACHE_MAX_ENTRIES must be >= 0"
+        raise ValueError(msg)
 
     telemetry = TelemetrySettings(
         prometheus_port=_int(cfg, "PROMETHEUS_PORT", default=9000),
@@ -424,5 +439,11 @@ def get_settings(env_path: str = ".env") -> Settings:
     )
 
 
+def reset_settings_cache() -> None:
+    """Drop the memoized settings so the next ``get_settings`` re-reads the env file."""
+
+    get_settings.cache_clear()
+
+
 # Statically importable settings singleton for modules that prefer constants over DI.
 settings: Final[Settings] = get_settings()
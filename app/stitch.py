@@ -5,8 +5,10 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass
 import difflib
+from functools import lru_cache
+import io
 import re
-from typing import Sequence
+from typing import Sequence, TextIO
 from urllib.parse import quote_plus
 
 from app.dedup import deduplicate_tile_overlap, DeduplicationResult
@@ -14,14 +16,21 @@ from app.dom_links import DomHeading, DomTextOverlay, normalize_heading_text
 from app.settings import get_settings
 from app.tiler import TileSlice
 
-_HEADING_RE = re.compile(r"^(#{1,6})(\s+.+)")
+# Matches the raw line: surrounding whitespace is absorbed by the pattern instead
+# of a per-line ``strip()``, and group 3 is the heading text without padding.
+# ATX headings only allow spaces/tabs around the marker, so explicit ASCII classes
+# (and re.ASCII for ``\S``) keep the hot match off the Unicode whitespace tables.
+_HEADING_RE = re.compile(r"^[ \t]*(#{1,6})([ \t]+)(.*\S)[ \t]*$", re.ASCII)
 _HEADING_PREFIX_RE = re.compile(r"^\s*(?:>+\s*)*(?:#{1,6}\s+)")
 _ORDERED_LIST_PREFIX_RE = re.compile(r"^\s*(?:>+\s*)*(?:\d+\.\s+)")
 _UNORDERED_LIST_PREFIX_RE = re.compile(r"^\s*(?:>+\s*)*(?:[-+*]\s+)")
 _BLOCKQUOTE_PREFIX_RE = re.compile(r"^\s*>+\s*")
 _LEADING_WS_RE = re.compile(r"^\s+")
 _SPACED_LETTERS_RE = re.compile(r"(?:[A-Za-z]\s+){3,}[A-Za-z]")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 _CODE_FENCE_PREFIXES = ("```", "~~~")
+_HEADING_MARKERS = tuple("#" * level for level in range(7))
+_NOISY_PUNCTUATION = frozenset("!?…")
 
 
 @dataclass(slots=True)
@@ -64,19 +73,28 @@ class HeadingGuide:
     """DOM-aware helper that aligns OCR headings with the source outline."""
 
     def __init__(self, headings: Sequence[DomHeading]) -> None:
-        self._headings = list(headings)
+        # normalized text -> outline positions (ascending) so a lookup never walks
+        # past headings with other text.
+        self._by_normalized: dict[str, deque[tuple[int, int]]] = {}
+        for idx, heading in enumerate(headings):
+            self._by_normalized.setdefault(heading.normalized, deque()).append((idx, heading.level))
         self._cursor = 0
 
     def target_level(self, heading_text: str) -> int | None:
         normalized = normalize_heading_text(heading_text)
         if not normalized:
             return None
-        for idx in range(self._cursor, len(self._headings)):
-            candidate = self._headings[idx]
-            if candidate.normalized == normalized:
-                self._cursor = idx + 1
-                return candidate.level
-        return None
+        positions = self._by_normalized.get(normalized)
+        if not positions:
+            return None
+        # Entries behind the cursor can never match again; drop them for good.
+        while positions and positions[0][0] < self._cursor:
+            positions.popleft()
+        if not positions:
+            return None
+        idx, level = positions.popleft()
+        self._cursor = idx + 1
+        return level
 
 
 class DomOverlayIndex:
@@ -88,6 +106,29 @@ class DomOverlayIndex:
                     continue
                 queue = self._map.setdefault(entry.normalized, deque())
                 queue.append(entry)
+        # ``normalize_heading_text`` keeps only [a-z0-9] plus collapsed spaces, and
+        # the overlay pass normalizes the whole line (or the line joined with its
+        # hyphen-break continuation). A key can therefore only match a line whose
+        # lowercased alphanumerics equal the key's, which is one set lookup per
+        # line however many overlays there are.
+        self._alnum_keys = frozenset(key.replace(" ", "") for key in self._map)
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def may_match(self, line: str, next_line: str | None) -> bool:
+        """Cheap pre-check: can any overlay key normalize out of this line?"""
+
+        keys = self._alnum_keys
+        if not keys:
+            return False
+        alnum = _NON_ALNUM_RE.sub("", line.lower())
+        if alnum in keys:
+            return True
+        # Hyphen breaks normalize the line together with its continuation.
+        if next_line and line.rstrip().endswith("-"):
+            return alnum + _NON_ALNUM_RE.sub("", next_line.lower()) in keys
+        return False
 
     def lookup(self, normalized: str) -> DomTextOverlay | None:
         if not normalized:
@@ -101,6 +142,23 @@ class DomOverlayIndex:
         return overlay
 
 
+class _BlockWriter:
+    """Write Markdown blocks to a text stream, separated by blank lines."""
+
+    __slots__ = ("_write", "_started")
+
+    def __init__(self, stream: TextIO) -> None:
+        self._write = stream.write
+        self._started = False
+
+    def emit(self, block: str) -> None:
+        if self._started:
+            self._write("\n\n")
+        else:
+            self._started = True
+        self._write(block)
+
+
 def stitch_markdown(
     chunks: Sequence[str],
     tiles: Sequence[TileSlice] | None = None,
@@ -109,6 +167,7 @@ def stitch_markdown(
     dom_overlays: Sequence[DomTextOverlay] | None = None,
     job_id: str | None = None,
     deduplicate_overlaps: bool | None = None,
+    sink: TextIO | None = None,
 ) -> StitchResult:
     """Join OCR-derived Markdown segments with provenance + DOM assists.
 
@@ -119,6 +178,8 @@ def stitch_markdown(
         dom_overlays: DOM text overlays for error correction
         job_id: Job ID for highlight URL generation
         deduplicate_overlaps: Enable overlap deduplication (defaults to settings value)
+        sink: Optional text stream that receives the Markdown incrementally instead
+            of it being assembled in memory; ``StitchResult.markdown`` is then empty
 
     Returns:
         StitchResult with markdown, dom_assists, seam_marker_events, and dedup_events
@@ -133,13 +194,17 @@ def stitch_markdown(
         deduplicate_overlaps if deduplicate_overlaps is not None else settings.deduplication.enabled
     )
 
-    processed: list[str] = []
+    output = sink if sink is not None else io.StringIO()
+    emit = _BlockWriter(output).emit
     last_heading_level = 0
     last_table_signature: str | None = None
     previous_tile: TileSlice | None = None
     previous_chunk: str = ""
     heading_guide = HeadingGuide(dom_headings) if dom_headings else None
     overlay_index = DomOverlayIndex(dom_overlays)
+    # One matcher serves every seam: set_seq2 keeps the b2j index built for the
+    # previous header signature until that signature actually changes.
+    header_matcher = difflib.SequenceMatcher(None, autojunk=False)
     dom_assists: list[DomAssistEntry] = []
     seam_events: list[SeamMarkerEvent] = []
     dedup_events: list[DeduplicationResult] = []
@@ -167,7 +232,10 @@ def stitch_markdown(
             if dedup_result.lines_removed > 0:
                 dedup_events.append(dedup_result)
                 if settings.deduplication.log_events:
-                    processed.append(_format_dedup_comment(dedup_result))
+                    emit(_format_dedup_comment(dedup_result))
+
+        # Resolved once per seam; the table trim and the seam marker both need it.
+        overlap_match, used_seam_marker = _tiles_share_overlap(previous_tile, tile)
 
         lines, last_heading_level, heading_changes = _normalize_headings(
             lines, last_heading_level, heading_guide
@@ -175,8 +243,8 @@ def stitch_markdown(
         lines, last_table_signature, table_trim = _trim_duplicate_table_header(
             lines,
             last_table_signature,
-            previous_tile,
-            tile,
+            overlap_match,
+            header_matcher,
         )
 
         if overlay_index:
@@ -186,10 +254,9 @@ def stitch_markdown(
             if assists:
                 dom_assists.extend(assists)
                 for assist in assists:
-                    processed.append(_format_dom_assist_comment(assist))
+                    emit(_format_dom_assist_comment(assist))
 
         if tile and previous_tile:
-            overlap_match, used_seam_marker = _tiles_share_overlap(previous_tile, tile)
             if overlap_match:
                 if used_seam_marker:
                     seam_events.append(
@@ -201,22 +268,22 @@ def stitch_markdown(
                             curr_overlap_hash=tile.top_overlap_sha256,
                         )
                     )
-                processed.append(_format_seam_marker(previous_tile, tile))
+                emit(_format_seam_marker(previous_tile, tile))
         if tile:
-            processed.append(_format_provenance(tile, job_id=job_id))
+            emit(_format_provenance(tile, job_id=job_id))
         for original in heading_changes:
-            processed.append(f"<!-- normalized-heading: {original} -->")
+            emit(f"<!-- normalized-heading: {original} -->")
         if table_trim:
-            processed.append(_format_table_trim_comment(table_trim))
+            emit(_format_table_trim_comment(table_trim))
 
-        body = "\n".join(lines).strip("\n")
-        if body and body.strip():
-            processed.append(body)
+        body = _join_trimmed(lines)
+        if body and not body.isspace():
+            emit(body)
         previous_tile = tile if tile else previous_tile
         previous_chunk = chunk  # Save for next iteration's deduplication
 
     return StitchResult(
-        markdown="\n\n".join(processed),
+        markdown="" if sink is not None else output.getvalue(),
         dom_assists=dom_assists,
         seam_marker_events=seam_events,
         dedup_events=dedup_events,
@@ -229,6 +296,23 @@ def _split_lines(chunk: str) -> list[str]:
     return chunk.splitlines()
 
 
+def _join_trimmed(lines: list[str]) -> str:
+    """Join lines, dropping leading and trailing empty ones.
+
+    Equivalent to joining and then stripping newlines, but trims the slice bounds
+    first so the full joined string is never built just to be copied by the strip.
+    """
+
+    start, end = 0, len(lines)
+    while start < end and not lines[start]:
+        start += 1
+    while end > start and not lines[end - 1]:
+        end -= 1
+    if start == 0 and end == len(lines):
+        return "\n".join(lines)
+    return "\n".join(lines[start:end])
+
+
 def _normalize_headings(
     lines: list[str],
     last_level: int,
@@ -238,13 +322,16 @@ def _normalize_headings(
 
     normalized: list[str] = []
     changed_headings: list[str] = []
+    # Bound once: most lines are not headings and only pay the match + append.
+    match_heading = _HEADING_RE.match
+    keep = normalized.append
     for line in lines:
-        match = _HEADING_RE.match(line.strip())
+        match = match_heading(line)
         if not match:
-            normalized.append(line)
+            keep(line)
             continue
         level = len(match.group(1))
-        heading_text = match.group(2).strip()
+        heading_text = match.group(3)
         dom_level = guide.target_level(heading_text) if guide else None
         target_level = dom_level or level
         if dom_level is None:
@@ -253,13 +340,11 @@ def _normalize_headings(
             else:
                 target_level = min(level, 2)
         if target_level != level:
-            hashes = "#" * target_level
-            remainder = match.group(2)
-            normalized.append(f"{hashes}{remainder}")
+            keep(f"{_HEADING_MARKERS[target_level]}{match.group(2)}{heading_text}")
             changed_headings.append(line.strip())
             last_level = target_level
         else:
-            normalized.append(line)
+            keep(line)
             last_level = level
     return normalized, last_level, changed_headings
 
@@ -267,8 +352,8 @@ def _normalize_headings(
 def _trim_duplicate_table_header(
     lines: list[str],
     last_signature: str | None,
-    prev_tile: TileSlice | None,
-    tile: TileSlice | None,
+    overlap_match: bool,
+    matcher: difflib.SequenceMatcher | None = None,
 ) -> tuple[list[str], str | None, TrimmedHeaderInfo | None]:
     """Drop repeated Markdown table header rows emitted across tiles."""
 
@@ -277,11 +362,13 @@ def _trim_duplicate_table_header(
         return lines, last_signature, None
 
     header_signature, header_start = extraction
+    if header_signature == last_signature:
+        # Carry the existing object forward so the matcher's set_seq2 stays a no-op.
+        header_signature = last_signature
     header_end = header_start + 2
     prefix = lines[:header_start]
     suffix = lines[header_end:]
 
-    overlap_match, _ = _tiles_share_overlap(prev_tile, tile)
     identical = header_signature == last_signature and overlap_match
     trimmed_info: TrimmedHeaderInfo | None = None
 
@@ -292,7 +379,7 @@ def _trim_duplicate_table_header(
 
     similarity = None
     if overlap_match and last_signature:
-        similarity = _header_similarity(header_signature, last_signature)
+        similarity = _header_similarity(header_signature, last_signature, matcher)
         if similarity >= 0.92:
             trimmed = prefix + suffix
             trimmed_info = TrimmedHeaderInfo(reason="similar", similarity=similarity)
@@ -303,31 +390,28 @@ def _trim_duplicate_table_header(
 
 def _extract_table_header_signature(lines: list[str]) -> tuple[str, int] | None:
     start = _locate_table_header_start(lines)
-    if start is None or start + 1 >= len(lines):
-        return None
-    header = lines[start].strip()
-    separator = lines[start + 1].strip()
-    if "|" not in header or "|" not in separator:
-        return None
-    if "---" not in separator:
+    if start is None:
         return None
-    signature = f"{header}\n{separator}"
+    # The locator already checked the pipes/dashes on the raw lines; stripping
+    # cannot remove them, so only the signature itself is built here.
+    signature = f"{lines[start].strip()}\n{lines[start + 1].strip()}"
     return signature, start
 
 
 def _locate_table_header_start(lines: list[str]) -> int | None:
+    # Most chunks do not open with a table, so every check runs on the raw line
+    # first and a line is only stripped once it might be an inline comment.
     idx = 0
     limit = len(lines) - 1
     while idx < limit:
-        stripped = lines[idx].strip()
-        if not stripped:
+        line = lines[idx]
+        if not line or line.isspace() or ("<!--" in line and _is_inline_comment(line.strip())):
             idx += 1
             continue
-        if _is_inline_comment(stripped):
-            idx += 1
-            continue
-        next_line = lines[idx + 1].strip()
-        if "|" in stripped and "|" in next_line and "---" in next_line:
+        if "|" not in line:
+            return None
+        next_line = lines[idx + 1]
+        if "|" in next_line and "---" in next_line:
             return idx
         return None
     return None
@@ -337,8 +421,16 @@ def _is_inline_comment(line: str) -> bool:
     return line.startswith("<!--") and line.endswith("-->")
 
 
-def _header_similarity(sig_a: str, sig_b: str) -> float:
-    return difflib.SequenceMatcher(a=sig_a, b=sig_b).ratio()
+def _header_similarity(
+    sig_a: str, sig_b: str, matcher: difflib.SequenceMatcher | None = None
+) -> float:
+    # autojunk would treat the repeated '-' and '|' of separator rows as junk on
+    # wide tables (signatures >= 200 chars) and under-report their similarity.
+    if matcher is None:
+        matcher = difflib.SequenceMatcher(None, autojunk=False)
+    matcher.set_seq2(sig_b)  # no-op while sig_b is the same object as last time
+    matcher.set_seq1(sig_a)
+    return matcher.ratio()
 
 
 def _tiles_share_overlap(prev_tile: TileSlice | None, tile: TileSlice | None) -> tuple[bool, bool]:
@@ -355,40 +447,40 @@ def _tiles_share_overlap(prev_tile: TileSlice | None, tile: TileSlice | None) ->
 
 def _format_seam_marker(prev_tile: TileSlice, tile: TileSlice) -> str:
     overlap_hash = prev_tile.bottom_overlap_sha256 or tile.top_overlap_sha256 or "unknown"
-    parts = [
-        "<!-- seam-marker:",
-        f"prev=tile_{prev_tile.index:04d}",
-        f"curr=tile_{tile.index:04d}",
-        f"overlap_hash={overlap_hash}",
-    ]
+    seam = ""
     if prev_tile.seam_bottom_hash and tile.seam_top_hash:
-        parts.append(f"seam_hash={prev_tile.seam_bottom_hash}")
-    parts.append("-->")
-    return " ".join(parts)
+        seam = f" seam_hash={prev_tile.seam_bottom_hash}"
+    # A single f-string compiles to one BUILD_STRING join; these comments are emitted
+    # once per tile, so skip the intermediate parts list + separate join.
+    return (
+        f"<!-- seam-marker: prev=tile_{prev_tile.index:04d} curr=tile_{tile.index:04d} "
+        f"overlap_hash={overlap_hash}{seam} -->"
+    )
 
 
 def _format_provenance(tile: TileSlice, *, job_id: str | None = None) -> str:
-    path = f"artifact/tiles/tile_{tile.index:04d}.png"
-    parts = [
-        f"tile_{tile.index:04d}",
-        f"y={tile.source_y_offset}",
-        f"height={tile.height}",
-        f"sha256={tile.sha256}",
-        f"scale={tile.scale:.2f}",
-        f"viewport_y={tile.viewport_y_offset}",
-        f"overlap_px={tile.overlap_px}",
-        f"path={path}",
-    ]
+    name = f"tile_{tile.index:04d}"
+    path = f"artifact/tiles/{name}.png"
+    highlight = ""
     if job_id:
-        highlight = _build_highlight_url(job_id=job_id, tile_path=path, start=0, end=tile.height)
-        parts.append(f"highlight={highlight}")
-    return f"<!-- source: {', '.join(parts)} -->"
+        url = _build_highlight_url(job_id=job_id, tile_index=tile.index, start=0, end=tile.height)
+        highlight = f", highlight={url}"
+    return (
+        f"<!-- source: {name}, y={tile.source_y_offset}, height={tile.height}, "
+        f"sha256={tile.sha256}, scale={tile.scale:.2f}, viewport_y={tile.viewport_y_offset}, "
+        f"overlap_px={tile.overlap_px}, path={path}{highlight} -->"
+    )
+
 
+@lru_cache(maxsize=4096)
+def _encoded_tile_path(index: int) -> str:
+    return quote_plus(f"artifact/tiles/tile_{index:04d}.png")
 
-def _build_highlight_url(*, job_id: str, tile_path: str, start: int, end: int) -> str:
+
+def _build_highlight_url(*, job_id: str, tile_index: int, start: int, end: int) -> str:
     start = max(0, start)
     end = max(start + 1, end)
-    query = f"tile={quote_plus(tile_path)}&y0={start}&y1={end}"
+    query = f"tile={_encoded_tile_path(tile_index)}&y0={start}&y1={end}"
     return f"/jobs/{job_id}/artifact/highlight?{query}"
 
 
@@ -400,6 +492,12 @@ def _apply_dom_overlays(
 ) -> tuple[list[str], list[DomAssistEntry]]:
     updated: list[str] = []
     assists: list[DomAssistEntry] = []
+    # Code-fence and skip-next state rule out a comprehension; binding the hot
+    # methods once still keeps the per-line fast path free of attribute lookups.
+    emit = updated.append
+    may_match = overlay_index.may_match
+    lookup = overlay_index.lookup
+    line_issue = _line_issue
     skip_next = False
     in_code_fence = False
     code_delimiter: str | None = None
@@ -416,13 +514,16 @@ def _apply_dom_overlays(
             else:
                 in_code_fence = True
                 code_delimiter = fence
-            updated.append(line)
+            emit(line)
             continue
         if in_code_fence or _is_indented_code_block(line):
-            updated.append(line)
+            emit(line)
             continue
         next_line = lines[line_idx + 1] if line_idx + 1 < len(lines) else None
-        reason = _line_issue(line, next_line)
+        if not may_match(line, next_line):
+            emit(line)
+            continue
+        reason = line_issue(line, next_line)
         if reason:
             stripped = line.lstrip("# ").strip()
             normalized = ""
@@ -444,10 +545,10 @@ def _apply_dom_overlays(
                     else:
                         normalized = normalize_heading_text(stripped)
             if normalized:
-                overlay = overlay_index.lookup(normalized)
+                overlay = lookup(normalized)
                 if overlay:
                     replacement = _merge_overlay(line, overlay.text)
-                    updated.append(replacement)
+                    emit(replacement)
                     assists.append(
                         DomAssistEntry(
                             tile_index=tile_index,
@@ -460,7 +561,7 @@ def _apply_dom_overlays(
                     if consume_next:
                         skip_next = True
                     continue
-        updated.append(line)
+        emit(line)
     return updated, assists
 
 
@@ -472,13 +573,21 @@ def _line_issue(line: str, next_line: str | None) -> str | None:
         return "replacement-char"
     if _SPACED_LETTERS_RE.search(stripped):
         return "spaced-letters"
-    noisy = sum(1 for char in stripped if char in "!?…")
+    # One pass collects every per-character count the remaining rules need.
+    noisy = alpha = 0
+    has_digit = False
+    for char in stripped:
+        if char in _NOISY_PUNCTUATION:
+            noisy += 1
+        elif char.isalpha():
+            alpha += 1
+        elif char.isdigit():
+            has_digit = True
     if noisy >= 3:
         return "punctuation"
-    if any(char.isdigit() for char in stripped) and any(char.isalpha() for char in stripped):
+    if has_digit and alpha:
         return "mixed-numeric"
-    alpha = sum(1 for char in stripped if char.isalpha())
-    ratio = alpha / max(1, len(stripped))
+    ratio = alpha / len(stripped)
     if ratio < 0.45 and len(stripped) >= 6:
         return "low-alpha"
     if stripped.endswith("-") and next_line:
@@ -515,26 +624,20 @@ def _format_dom_assist_comment(entry: DomAssistEntry) -> str:
 
 
 def _format_table_trim_comment(info: TrimmedHeaderInfo) -> str:
-    parts = ["table-header-trimmed", f"reason={info.reason}"]
-    if info.similarity is not None:
-        parts.append(f"similarity={info.similarity:.2f}")
-    return f"<!-- {' '.join(parts)} -->"
+    if info.similarity is None:
+        return f"<!-- table-header-trimmed reason={info.reason} -->"
+    return f"<!-- table-header-trimmed reason={info.reason} similarity={info.similarity:.2f} -->"
 
 
 def _format_dedup_comment(result: DeduplicationResult) -> str:
     """Format deduplication event as HTML comment."""
-    parts = [
-        "overlap-dedup:",
-        f"prev=tile_{result.prev_tile_index:04d}",
-        f"curr=tile_{result.curr_tile_index:04d}",
-        f"removed={result.lines_removed}",
-        f"method={result.method}",
-    ]
-    if result.similarity is not None:
-        parts.append(f"similarity={result.similarity:.3f}")
-    if result.overlap_hash:
-        parts.append(f"hash={result.overlap_hash[:8]}")
-    return f"<!-- {' '.join(parts)} -->"
+    similarity = "" if result.similarity is None else f" similarity={result.similarity:.3f}"
+    overlap_hash = f" hash={result.overlap_hash[:8]}" if result.overlap_hash else ""
+    return (
+        f"<!-- overlap-dedup: prev=tile_{result.prev_tile_index:04d} "
+        f"curr=tile_{result.curr_tile_index:04d} removed={result.lines_removed} "
+        f"method={result.method}{similarity}{overlap_hash} -->"
+    )
 
 
 def _detect_code_fence(line: str) -> str | None:
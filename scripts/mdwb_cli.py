@@ -33,6 +33,7 @@ from typing import (
 )
 
 import httpx
+import orjson
 import sys
 import typer
 from decouple import Config as DecoupleConfig, RepositoryEnv
@@ -363,31 +364,37 @@ class ResumeManager:
         if not flag.exists():
             payload = {"timestamp": datetime.now(timezone.utc).isoformat(), "entry": entry}
             flag.write_text(json.dumps(payload), encoding="utf-8")
-            self._done_cache = None
-            self._done_entries_cache = None
+            # Fold the new flag into the caches instead of rescanning done_dir on
+            # the next is_complete() call of a long fetch loop.
+            if self._done_cache is not None:
+                self._done_cache.add(group_hash)
+            if self._done_entries_cache is not None:
+                self._done_entries_cache.setdefault(group_hash, entry)
 
     def _done_hashes(self) -> set[str]:
         if self._done_cache is not None:
             return self._done_cache
+        # Names only: scandir's d_type answers is_file() without a stat, and flag
+        # contents are read lazily by _done_entries() for the listing commands.
         hashes: set[str] = set()
-        entries: dict[str, str | None] = {}
-        if self.done_dir.exists():
-            for child in self.done_dir.iterdir():
-                if not child.is_file():
-                    continue
-                name = child.name
-                if name.startswith("done_") and name.endswith(".flag"):
-                    hash_value = name[len("done_") : -len(".flag")]
-                    hashes.add(hash_value)
-                    entries.setdefault(hash_value, self._read_flag_entry(child))
+        try:
+            with os.scandir(self.done_dir) as children:
+                for child in children:
+                    name = child.name
+                    if name.startswith("done_") and name.endswith(".flag") and child.is_file():
+                        hashes.add(name[len("done_") : -len(".flag")])
+        except FileNotFoundError:
+            pass
         self._done_cache = hashes
-        self._done_entries_cache = entries
         return hashes
 
     def _done_entries(self) -> dict[str, str | None]:
         if self._done_entries_cache is None:
-            self._done_hashes()
-        return self._done_entries_cache or {}
+            self._done_entries_cache = {
+                hash_value: self._read_flag_entry(self.done_dir / f"done_{hash_value}.flag")
+                for hash_value in self._done_hashes()
+            }
+        return self._done_entries_cache
 
     def _read_flag_entry(self, flag_path: Path) -> str | None:
         try:
@@ -854,22 +861,42 @@ def _run_hook(command: str, event_name: str, payload: Mapping[str, Any]) -> None
         console.print(f"[yellow]Hook command '{command}' failed: {exc}[/]")
 
 
+_SSE_EVENT_PREFIX = b"event:"
+_SSE_DATA_PREFIX = b"data:"
+
+
 def _iter_sse(response: httpx.Response) -> Iterable[Tuple[str, str]]:
+    # Split raw bytes on blank-line event boundaries and decode each block once,
+    # instead of decoding + dispatching the stream line by line.
+    buffer = b""
+    for chunk in response.iter_bytes():
+        buffer += chunk
+        if b"\r" in buffer:
+            buffer = buffer.replace(b"\r\n", b"\n")
+        if b"\n\n" not in buffer:
+            continue
+        *blocks, buffer = buffer.split(b"\n\n")
+        for block in blocks:
+            parsed = _parse_sse_block(block)
+            if parsed is not None:
+                yield parsed
+    if buffer:
+        parsed = _parse_sse_block(buffer)
+        if parsed is not None:
+            yield parsed
+
+
+def _parse_sse_block(block: bytes) -> Tuple[str, str] | None:
     event = "message"
     data_lines: list[str] = []
-    for line in response.iter_lines():
-        if not line:
-            if data_lines:
-                yield event, "\n".join(data_lines)
-            event = "message"
-            data_lines = []
-            continue
-        if line.startswith("event:"):
-            event = line.split(":", 1)[1].strip()
-        elif line.startswith("data:"):
-            data_lines.append(line.split(":", 1)[1].strip())
-    if data_lines:
-        yield event, "\n".join(data_lines)
+    for raw in block.split(b"\n"):
+        if raw.startswith(_SSE_EVENT_PREFIX):
+            event = raw[6:].strip().decode("utf-8", "replace")
+        elif raw.startswith(_SSE_DATA_PREFIX):
+            data_lines.append(raw[5:].strip().decode("utf-8", "replace"))
+    if not data_lines:
+        return None
+    return event, "\n".join(data_lines)
 
 
 def _stream_job(
@@ -1571,6 +1598,15 @@ def _parse_json_payload(payload: str) -> Any:
         return None
 
 
+def _pretty_json_bytes(payload: bytes) -> bytes:
+    """Re-indent a JSON artifact straight from bytes (returned unchanged if unparsable)."""
+
+    try:
+        return orjson.dumps(orjson.loads(payload), option=orjson.OPT_INDENT_2)
+    except orjson.JSONDecodeError:
+        return payload
+
+
 def _write_text_output(content: str, path: str | None, *, description: str) -> None:
     if path:
         out_path = Path(path)
@@ -2555,12 +2591,8 @@ def jobs_manifest(
             console.print(f"[red]Job {job_id} not found.[/]")
             raise typer.Exit(code=1)
         response.raise_for_status()
-        text = response.text
-        if pretty:
-            parsed = _parse_json_payload(text)
-            if parsed is not None:
-                text = json.dumps(parsed, indent=2)
-        _write_text_output(text, out, description="manifest")
+        content = _pretty_json_bytes(response.content) if pretty else response.content
+        _write_binary_output(content, out, description="manifest")
 
 
 @jobs_artifacts_cli.command("markdown")
@@ -2593,12 +2625,8 @@ def jobs_links(
             console.print(f"[red]Job {job_id} not found.[/]")
             raise typer.Exit(code=1)
         response.raise_for_status()
-        text = response.text
-        if pretty:
-            parsed = _parse_json_payload(text)
-            if parsed is not None:
-                text = json.dumps(parsed, indent=2)
-        _write_text_output(text, out, description="links")
+        content = _pretty_json_bytes(response.content) if pretty else response.content
+        _write_binary_output(content, out, description="links")
 
 
 @jobs_artifacts_cli.command("bundle")
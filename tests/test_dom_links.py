@@ -1,15 +1,132 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
+from app import dom_links
 from app.dom_links import (
     LinkRecord,
     blend_dom_with_ocr,
     extract_dom_text_overlays,
     extract_headings_from_html,
+    extract_links_from_dom,
     extract_links_from_markdown,
     serialize_links,
 )
 
 
+def test_extract_links_from_dom_reads_anchors_and_forms(tmp_path: Path) -> None:
+    snapshot = tmp_path / "dom.html"
+    snapshot.write_text(
+        """
+        <html>
+          <body>
+            <a href="https://example.com/docs" rel="noopener nofollow" target="_blank">
+              Docs <b>Home</b>
+            </a>
+            <a>No href</a>
+            <A HREF="#top">Top</A>
+            <form action="/search" aria-label="Search"></form>
+            <form></form>
+          </body>
+        </html>
+        """,
+        encoding="utf-8",
+    )
+
+    records = extract_links_from_dom(snapshot)
+
+    anchors = [record for record in records if record.kind == "anchor"]
+    forms = [record for record in records if record.kind == "form"]
+    assert [record.href for record in anchors] == ["https://example.com/docs", "#top"]
+    assert anchors[0].text == "DocsHome"
+    assert anchors[0].rel == ("noopener", "nofollow")
+    assert anchors[0].target == "_blank"
+    assert anchors[0].domain == "example.com"
+    assert anchors[1].domain == "(fragment)"
+    assert len(forms) == 1
+    assert forms[0].text == "Search"
+    assert forms[0].href == "/search"
+    assert forms[0].domain == "(relative)"
+
+
+def test_extract_links_from_dom_keeps_tree_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    block = (
+        '<div><p>intro</p><a href="https://example.com/{idx}">Link <b>{idx}</b></a>'
+        "<p>outro</p><ul>" + "<li>item</li>" * 5 + "</ul></div>"
+    )
+    snapshot = tmp_path / "dom.html"
+    snapshot.write_text(
+        "<html><body>" + "".join(block.format(idx=idx) for idx in range(2000)) + "</body></html>",
+        encoding="utf-8",
+    )
+    live_sizes: list[int] = []
+    original = dom_links._link_record_from_element
+
+    def _spy(element):  # noqa: ANN001, ANN202
+        live_sizes.append(sum(1 for _ in element.getroottree().getroot().iter()))
+        return original(element)
+
+    monkeypatch.setattr(dom_links, "_link_record_from_element", _spy)
+
+    records = extract_links_from_dom(snapshot)
+
+    assert len(records) == 2000
+    assert records[-1].text == "Link1999"
+    # By the last anchor only its open ancestors are still attached; clearing
+    # just the link elements left every other subtree (~18k elements) in place.
+    assert live_sizes[-1] < 20
+
+
+def test_extract_links_from_dom_falls_back_past_libxml2_depth_limit(tmp_path: Path) -> None:
+    snapshot = tmp_path / "dom.html"
+    snapshot.write_text(
+        "<html><body>"
+        + "<div>" * 300
+        + '<a href="https://example.com/deep">Deep</a>'
+        + "</div>" * 300
+        + "</body></html>",
+        encoding="utf-8",
+    )
+
+    records = extract_links_from_dom(snapshot)
+
+    assert [(record.text, record.href) for record in records] == [
+        ("Deep", "https://example.com/deep")
+    ]
+
+
+def test_extract_links_from_dom_skips_script_and_style_text(tmp_path: Path) -> None:
+    snapshot = tmp_path / "dom.html"
+    snapshot.write_text(
+        '<a href="/x">a<script>var secret=1;</script>b<!-- note --><style>.x{}</style>c</a>',
+        encoding="utf-8",
+    )
+
+    assert [record.text for record in extract_links_from_dom(snapshot)] == ["abc"]
+
+
+def test_extract_links_from_dom_handles_empty_snapshot(tmp_path: Path) -> None:
+    snapshot = tmp_path / "dom.html"
+    snapshot.write_bytes(b"")
+
+    assert extract_links_from_dom(snapshot) == []
+
+
+def test_extract_links_from_dom_skips_snapshots_without_link_tags(tmp_path: Path) -> None:
+    snapshot = tmp_path / "dom.html"
+    snapshot.write_text(
+        "<html><head><script>var a = '<abbr>';</script></head>"
+        "<body><div id=root></div></body></html>",
+        encoding="utf-8",
+    )
+
+    assert extract_links_from_dom(snapshot) == []
+
+
 def test_extract_links_from_markdown_parses_basic_links() -> None:
     markdown = """
     Welcome to [Docs](https://example.com/docs)!
@@ -25,6 +142,51 @@ def test_extract_links_from_markdown_parses_basic_links() -> None:
     assert records[0].kind == "markdown"
 
 
+def test_extract_links_from_markdown_prefers_innermost_brackets() -> None:
+    markdown = "See [notes [Docs](https://example.com/docs) and [Help](http://example.com/h)"
+
+    records = extract_links_from_markdown(markdown)
+
+    assert [(record.text, record.href) for record in records] == [
+        ("Docs", "https://example.com/docs"),
+        ("Help", "http://example.com/h"),
+    ]
+
+
+def test_extract_links_from_markdown_handles_unterminated_input() -> None:
+    markdown = "[a](https://" * 5_000 + "x" * 10_000
+
+    records = extract_links_from_markdown(markdown)
+
+    # The trailing bare URL runs past the 2048-char href bound, so nothing matches.
+    assert records == []
+
+
+def test_extract_links_from_markdown_skips_urls_longer_than_cap() -> None:
+    long_url = "https://example.com/" + "a" * 3000
+    markdown = f"[Long]({long_url}) <{long_url}> {long_url} and https://example.com/ok"
+
+    records = extract_links_from_markdown(markdown)
+
+    assert [(record.kind, record.href) for record in records] == [("url", "https://example.com/ok")]
+
+
+def test_extract_links_from_markdown_handles_autolinks_and_bare_urls() -> None:
+    markdown = (
+        "Read [Docs](https://example.com/docs), mail <https://example.com/help> "
+        "or visit https://status.example.com/now."
+    )
+
+    records = extract_links_from_markdown(markdown)
+
+    assert [(record.kind, record.text, record.href) for record in records] == [
+        ("markdown", "Docs", "https://example.com/docs"),
+        ("autolink", "", "https://example.com/help"),
+        ("url", "", "https://status.example.com/now"),
+    ]
+    assert records[2].domain == "status.example.com"
+
+
 def test_blend_dom_with_ocr_marks_deltas() -> None:
     dom_links = [
         LinkRecord(
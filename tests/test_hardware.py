@@ -75,3 +75,16 @@ def test_hardware_snapshot_cache_reset() -> None:
     second = get_host_capabilities()
     assert first == second
     reset_host_capabilities_cache()
+
+
+def test_detect_host_capabilities_reads_gpu_numa_node(monkeypatch) -> None:
+    monkeypatch.setattr("app.hardware._pci_numa_node", lambda bus_id: 1 if bus_id else None)
+    snapshot = detect_host_capabilities(
+        command_runner=_runner(
+            "0, NVIDIA A100-SXM4-40GB, 40536, 550.54.15, 12.4, 00000000:3B:00.0\n"
+            "1, NVIDIA A100-SXM4-40GB, 40536, 550.54.15, 12.4, 00000000:5E:00.0\n"
+        )
+    )
+    assert [device.numa_node for device in snapshot.gpu_devices] == [1, 1]
+    assert snapshot.gpu_numa_node == 1
+    assert snapshot.to_dict()["gpu_devices"][0]["numa_node"] == 1
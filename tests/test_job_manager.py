@@ -237,6 +237,32 @@ async def test_job_manager_snapshot_queue(tmp_path: Path):
     assert states[-1] == JobState.DONE.value
 
 
+@pytest.mark.asyncio
+async def test_job_manager_coalesces_subscriber_bursts(tmp_path: Path):
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    manager = JobManager(store=Store(config), runner=_fake_runner)
+    snapshot = await manager.create_job(JobCreateRequest(url="https://example.com/burst"))
+    job_id = snapshot["id"]
+    await manager._tasks[job_id]
+
+    queue = manager.subscribe(job_id)
+    queue.get_nowait()  # initial snapshot
+    before = len(manager.get_events(job_id))
+
+    manager._set_state(job_id, JobState.NAVIGATING)
+    manager._set_state(job_id, JobState.CAPTURING)
+    manager._set_error(job_id, "boom")
+    assert queue.empty()
+
+    update = await asyncio.wait_for(queue.get(), timeout=1)
+    manager.unsubscribe(job_id, queue)
+
+    assert update["state"] == JobState.CAPTURING.value
+    assert update["error"] == "boom"
+    assert queue.empty()
+    assert len(manager.get_events(job_id)) == before + 3
+
+
 @pytest.mark.asyncio
 async def test_job_manager_event_log_records_history(tmp_path: Path):
     config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
@@ -677,3 +703,38 @@ def test_delete_webhook_unknown_job_propagates_keyerror():
 
     with pytest.raises(KeyError):
         manager.delete_webhook("missing-job", url="https://example.com/hook")
+
+
+@pytest.mark.asyncio
+async def test_job_manager_bounds_slow_subscriber_queue(tmp_path: Path):
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    manager = JobManager(store=Store(config), runner=_fake_runner)
+    snapshot = await manager.create_job(JobCreateRequest(url="https://example.com/slow"))
+    job_id = snapshot["id"]
+    await manager._tasks[job_id]
+
+    queue = manager.subscribe(job_id)
+    for state in (JobState.NAVIGATING, JobState.CAPTURING, JobState.TILING):
+        manager._set_state(job_id, state)
+        await asyncio.sleep(0)
+
+    drained = []
+    while not queue.empty():
+        drained.append(queue.get_nowait())
+    manager.unsubscribe(job_id, queue)
+
+    assert len(drained) == queue.maxsize
+    assert drained[-1]["state"] == JobState.TILING.value
+
+
+def test_initial_snapshot_manifests_do_not_share_nested_containers() -> None:
+    first = jobs_module.build_initial_snapshot("https://example.com/a", job_id="job-a")
+    second = jobs_module.build_initial_snapshot("https://example.com/b", job_id="job-b")
+
+    first["manifest"]["warnings"].append({"code": "test"})
+    first["manifest"]["fallback_chain"].append("extra-backend")
+    first["manifest"]["environment"]["cft_label"] = "mutated"
+
+    assert second["manifest"]["warnings"] == []
+    assert "extra-backend" not in second["manifest"]["fallback_chain"]
+    assert second["manifest"]["environment"]["cft_label"] != "mutated"
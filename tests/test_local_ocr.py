@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import replace
+import asyncio
+import base64
+import json
 import subprocess
+import sys
+import time
+from typing import Any, cast
 
+import httpx
 import pytest
 
 from app.hardware import GPUDeviceCapability, HardwareCapabilitySnapshot
 from app.local_ocr import (
+    LocalOCRClient,
     LocalOCRServiceManager,
+    LocalOCRServiceStatus,
     _build_start_plan,
+    _chat_request_template,
+    _get_probe_client,
     _normalize_endpoint,
+    _probe_candidates,
+    _probe_health,
+    _terminate_process,
+    close_local_ocr_clients,
 )
 from app.settings import get_settings
 
@@ -17,20 +32,17 @@ from app.settings import get_settings
 class _FakeProcess:
     def __init__(self, pid: int) -> None:
         self.pid = pid
-        self._alive = True
-
-    def poll(self) -> int | None:
-        return None if self._alive else 0
+        self.returncode: int | None = None
 
     def terminate(self) -> None:
-        self._alive = False
+        self.returncode = 0
 
-    def wait(self, timeout: int | float | None = None) -> int:  # noqa: ARG002
-        self._alive = False
+    async def wait(self) -> int:
+        self.returncode = 0
         return 0
 
     def kill(self) -> None:
-        self._alive = False
+        self.returncode = -9
 
 
 def _cpu_snapshot() -> HardwareCapabilitySnapshot:
@@ -122,10 +134,10 @@ async def test_ensure_service_reuses_existing_healthy_endpoint(monkeypatch: pyte
 
     monkeypatch.setattr("app.local_ocr._probe_health", _healthy_probe)
 
-    def _should_not_spawn(*_: object, **__: object) -> subprocess.Popen[str]:
+    async def _should_not_spawn(*_: object, **__: object) -> _FakeProcess:
         raise AssertionError("spawn should not be called when service is already healthy")
 
-    monkeypatch.setattr("app.local_ocr.subprocess.Popen", _should_not_spawn)
+    monkeypatch.setattr("app.local_ocr.asyncio.create_subprocess_exec", _should_not_spawn)
 
     status = await manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
     assert status.healthy is True
@@ -161,14 +173,14 @@ async def test_ensure_service_autostarts_when_unhealthy(monkeypatch: pytest.Monk
 
     popen_calls = 0
 
-    def _spawn(*_: object, **__: object) -> _FakeProcess:
+    async def _spawn(*_: object, **__: object) -> _FakeProcess:
         nonlocal popen_calls
         popen_calls += 1
         return _FakeProcess(pid=4321)
 
     monkeypatch.setattr("app.local_ocr._probe_health", _probe)
     monkeypatch.setattr(manager, "_wait_until_ready", _ready)
-    monkeypatch.setattr("app.local_ocr.subprocess.Popen", _spawn)
+    monkeypatch.setattr("app.local_ocr.asyncio.create_subprocess_exec", _spawn)
 
     status = await manager.ensure_service(settings=local_settings, capabilities=_gpu_snapshot())
     assert popen_calls == 1
@@ -230,14 +242,14 @@ async def test_ensure_service_retries_and_reports_failure(monkeypatch: pytest.Mo
     async def _never_ready(**_: object) -> bool:
         return False
 
-    def _spawn(*_: object, **__: object) -> _FakeProcess:
+    async def _spawn(*_: object, **__: object) -> _FakeProcess:
         nonlocal pid_counter
         pid_counter += 1
         return _FakeProcess(pid=pid_counter)
 
     monkeypatch.setattr("app.local_ocr._probe_health", _probe)
     monkeypatch.setattr(manager, "_wait_until_ready", _never_ready)
-    monkeypatch.setattr("app.local_ocr.subprocess.Popen", _spawn)
+    monkeypatch.setattr("app.local_ocr.asyncio.create_subprocess_exec", _spawn)
 
     status = await manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
     assert status.healthy is False
@@ -245,3 +257,461 @@ async def test_ensure_service_retries_and_reports_failure(monkeypatch: pytest.Mo
     assert status.reason == "startup-timeout"
     assert status.launch_attempts == 2
     assert status.restart_count == 1
+
+
+@pytest.mark.asyncio
+async def test_ensure_service_cools_down_between_spawn_rounds(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = LocalOCRServiceManager()
+    settings = get_settings()
+    local_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            local_url="http://localhost:8001/v1",
+            local_autostart=True,
+            local_max_restarts=0,
+            local_health_cache_s=0,
+        ),
+    )
+    spawns = 0
+
+    async def _probe(
+        endpoint: str, *, timeout: int  # noqa: ARG001
+    ) -> tuple[bool, int | None, str | None]:
+        return False, None, f"{endpoint}/models"
+
+    async def _never_ready(**_: object) -> bool:
+        return False
+
+    async def _spawn(*_: object, **__: object) -> _FakeProcess:
+        nonlocal spawns
+        spawns += 1
+        return _FakeProcess(pid=3000 + spawns)
+
+    monkeypatch.setattr("app.local_ocr._probe_health", _probe)
+    monkeypatch.setattr(manager, "_wait_until_ready", _never_ready)
+    monkeypatch.setattr("app.local_ocr.asyncio.create_subprocess_exec", _spawn)
+
+    first = await manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
+    second = await manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
+
+    assert first.reason == "startup-timeout"
+    assert second.action == "unavailable"
+    assert second.reason == "spawn-cooldown"
+    assert spawns == 1
+
+    manager._last_spawn_at = time.monotonic() - 60
+    third = await manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
+    assert third.reason == "startup-timeout"
+    assert spawns == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_returns_when_process_exits(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = LocalOCRServiceManager()
+
+    async def _hanging_probe(
+        endpoint: str, *, timeout: int  # noqa: ARG001
+    ) -> tuple[bool, int | None, str | None]:
+        await asyncio.sleep(30)
+        return False, None, None
+
+    monkeypatch.setattr("app.local_ocr._probe_health", _hanging_probe)
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", "import time; time.sleep(0.2)"
+    )
+    try:
+        started = time.monotonic()
+        ready = await manager._wait_until_ready(
+            endpoint="http://127.0.0.1:9/v1",
+            process=process,
+            startup_timeout_s=10,
+            health_timeout_s=10,
+        )
+        elapsed = time.monotonic() - started
+    finally:
+        await asyncio.wait_for(process.wait(), timeout=5)
+
+    assert ready is False
+    assert elapsed < 5
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_widens_probe_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = LocalOCRServiceManager()
+    timeouts: list[int] = []
+
+    async def _warming_probe(
+        endpoint: str, *, timeout: int  # noqa: ARG001
+    ) -> tuple[bool, int | None, str | None]:
+        timeouts.append(timeout)
+        return len(timeouts) == 3, 200, None
+
+    monkeypatch.setattr("app.local_ocr._probe_health", _warming_probe)
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", "import time; time.sleep(30)"
+    )
+    try:
+        ready = await manager._wait_until_ready(
+            endpoint="http://127.0.0.1:9/v1",
+            process=process,
+            startup_timeout_s=10,
+            health_timeout_s=2,
+        )
+    finally:
+        await _terminate_process(process)
+
+    assert ready is True
+    assert timeouts == [2, 4, 6]
+    # Two misses net of the final success carry over to the next readiness wait.
+    assert manager._local_health == 1
+
+
+@pytest.mark.asyncio
+async def test_probe_client_is_reused_until_closed() -> None:
+    client = _get_probe_client()
+    assert _get_probe_client() is client
+
+    await close_local_ocr_clients()
+
+    assert client.is_closed
+    replacement = _get_probe_client()
+    assert replacement is not client
+    await close_local_ocr_clients()
+
+
+@pytest.mark.asyncio
+async def test_process_batch_bounds_concurrency_and_preserves_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = LocalOCRClient()
+    in_flight = 0
+    peak = 0
+
+    async def _process_tile(tile: bytes, prompt: str | None = None) -> str:  # noqa: ARG001
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (len(tile) % 3))
+        in_flight -= 1
+        if tile == b"bad":
+            raise ValueError("boom")
+        return tile.decode()
+
+    monkeypatch.setattr(client, "process_tile", _process_tile)
+    tiles = [b"a", b"bb", b"bad", b"cccc", b"d", b"ee"]
+
+    async with client:
+        results = await client.process_batch(tiles, batch_size=2)
+
+    assert results == ["a", "bb", "", "cccc", "d", "ee"]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_process_tile_posts_openai_payload_with_inline_png() -> None:
+    captured: dict[str, object] = {}
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        captured["content_type"] = request.headers["content-type"]
+        captured["body"] = json.loads(request.content)
+        return httpx.Response(200, json={"choices": [{"message": {"content": " # Title \n"}}]})
+
+    client = LocalOCRClient(endpoint="http://ocr.test/v1/chat/completions")
+    await client.aclose()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+    async with client:
+        markdown = await client.process_tile(b"\x89PNG-bytes")
+
+    assert markdown == "# Title"
+    assert captured["content_type"] == "application/json"
+    body = cast(dict[str, Any], captured["body"])
+    image_part = body["messages"][0]["content"][1]
+    expected = base64.b64encode(b"\x89PNG-bytes").decode("ascii")
+    assert image_part["image_url"]["url"] == f"data:image/png;base64,{expected}"
+
+
+@pytest.mark.asyncio
+async def test_terminate_process_stops_child_without_threads() -> None:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", "import time; time.sleep(30)"
+    )
+
+    await _terminate_process(process)
+
+    assert process.returncode is not None
+    await _terminate_process(process)  # already exited: no-op
+
+
+def test_probe_candidates_are_memoized_per_endpoint() -> None:
+    candidates = _probe_candidates("http://localhost:8001/v1/")
+
+    assert candidates == ("http://localhost:8001/v1/models", "http://localhost:8001/health")
+    assert _probe_candidates("http://localhost:8001/v1/") is candidates
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ({"choices": [{"message": {"content": "  ok  "}}]}, "ok"),
+        ({"choices": [{"message": {"content": " "}, "text": "legacy"}]}, "legacy"),
+        ({"choices": [{"message": None, "text": "fallback"}]}, "fallback"),
+        ({"choices": []}, None),
+        ({"choices": [{"message": {"content": 42}}]}, None),
+    ],
+)
+async def test_process_tile_reads_content_or_text(
+    body: dict[str, Any], expected: str | None
+) -> None:
+    client = LocalOCRClient(endpoint="http://ocr.test/v1/chat/completions")
+    await client.aclose()
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _request: httpx.Response(200, json=body))
+    )
+
+    async with client:
+        if expected is None:
+            with pytest.raises(ValueError):
+                await client.process_tile(b"png")
+        else:
+            assert await client.process_tile(b"png") == expected
+
+
+@pytest.mark.asyncio
+async def test_probe_health_returns_first_healthy_candidate(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/models"):
+            await asyncio.sleep(30)
+            return httpx.Response(200)
+        return httpx.Response(200, json={"status": "ok"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    monkeypatch.setattr("app.local_ocr._get_probe_client", lambda: client)
+
+    started = time.monotonic()
+    healthy, status_code, probe_url = await _probe_health("http://127.0.0.1:8001/v1", timeout=10)
+    await client.aclose()
+
+    assert (healthy, status_code, probe_url) == (True, 200, "http://127.0.0.1:8001/health")
+    assert time.monotonic() - started < 5
+
+
+@pytest.mark.asyncio
+async def test_probe_health_reports_last_server_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/models"):
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(503)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    monkeypatch.setattr("app.local_ocr._get_probe_client", lambda: client)
+
+    result = await _probe_health("http://127.0.0.1:8001/v1", timeout=1)
+    await client.aclose()
+
+    assert result == (False, 503, "http://127.0.0.1:8001/health")
+
+
+@pytest.mark.asyncio
+async def test_ensure_service_reuses_recent_health_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = LocalOCRServiceManager()
+    settings = get_settings()
+    local_settings = replace(
+        settings,
+        ocr=replace(settings.ocr, local_url="http://localhost:8001/v1", local_health_cache_s=60),
+    )
+    probe_calls = 0
+
+    async def _probe(
+        endpoint: str, *, timeout: int  # noqa: ARG001
+    ) -> tuple[bool, int | None, str | None]:
+        nonlocal probe_calls
+        probe_calls += 1
+        return True, 200, f"{endpoint}/models"
+
+    monkeypatch.setattr("app.local_ocr._probe_health", _probe)
+
+    first = await manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
+    second = await manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
+    assert probe_calls == 1
+    assert second is first
+
+    manager.shutdown()
+    await manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
+    assert probe_calls == 2
+
+
+def test_build_start_plan_reuses_plan_for_same_inputs() -> None:
+    settings = get_settings()
+    plans = [
+        _build_start_plan(
+            settings,
+            endpoint="http://localhost:8001/v1",
+            capabilities=_cpu_snapshot(),
+            preferred_hardware_path="cpu",
+        )
+        for _ in range(2)
+    ]
+    first, second = plans
+
+    assert second is first
+    assert isinstance(first.command, tuple)
+    assert first.command[-2:] == ("--device", "cpu")
+
+
+def test_build_start_plan_pins_gpu_launch_to_numa_node(monkeypatch: pytest.MonkeyPatch) -> None:
+    gpu = _gpu_snapshot()
+    pinned = replace(
+        gpu, gpu_devices=tuple(replace(device, numa_node=1) for device in gpu.gpu_devices)
+    )
+    monkeypatch.setattr("app.local_ocr.shutil.which", lambda name: f"/usr/bin/{name}")
+
+    plan = _build_start_plan(
+        get_settings(),
+        endpoint="http://localhost:8011/v1",
+        capabilities=pinned,
+        preferred_hardware_path="gpu",
+    )
+
+    assert plan.command[:3] == ("numactl", "--cpunodebind=1", "--membind=1")
+    assert "--enable-prefix-caching" in plan.command
+
+
+@pytest.mark.asyncio
+async def test_ensure_service_single_flights_concurrent_callers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = LocalOCRServiceManager()
+    settings = get_settings()
+    local_settings = replace(
+        settings,
+        ocr=replace(settings.ocr, local_url="http://localhost:8001/v1", local_health_cache_s=0),
+    )
+    probe_calls = 0
+
+    async def _probe(
+        endpoint: str, *, timeout: int  # noqa: ARG001
+    ) -> tuple[bool, int | None, str | None]:
+        nonlocal probe_calls
+        probe_calls += 1
+        await asyncio.sleep(0.05)
+        return True, 200, f"{endpoint}/models"
+
+    monkeypatch.setattr("app.local_ocr._probe_health", _probe)
+
+    statuses = await asyncio.gather(
+        *(
+            manager.ensure_service(settings=local_settings, capabilities=_cpu_snapshot())
+            for _ in range(5)
+        )
+    )
+
+    assert probe_calls == 1
+    assert all(status is statuses[0] for status in statuses)
+    assert manager._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_ensure_service_does_not_share_flights_across_caller_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = LocalOCRServiceManager()
+    settings = get_settings()
+    base_ocr = replace(settings.ocr, local_url="http://localhost:8001/v1", local_health_cache_s=0)
+    no_autostart = replace(settings, ocr=replace(base_ocr, local_autostart=False))
+    autostart = replace(settings, ocr=replace(base_ocr, local_autostart=True))
+
+    async def _probe(
+        endpoint: str, *, timeout: int  # noqa: ARG001
+    ) -> tuple[bool, int | None, str | None]:
+        await asyncio.sleep(0.05)
+        return False, None, f"{endpoint}/models"
+
+    async def _ready(**_: object) -> bool:
+        return True
+
+    async def _spawn(*_: object, **__: object) -> _FakeProcess:
+        return _FakeProcess(pid=4242)
+
+    monkeypatch.setattr("app.local_ocr._probe_health", _probe)
+    monkeypatch.setattr(manager, "_wait_until_ready", _ready)
+    monkeypatch.setattr("app.local_ocr.asyncio.create_subprocess_exec", _spawn)
+
+    disabled, started = await asyncio.gather(
+        manager.ensure_service(settings=no_autostart, capabilities=_cpu_snapshot()),
+        manager.ensure_service(settings=autostart, capabilities=_cpu_snapshot()),
+    )
+
+    assert disabled.reason == "autostart-disabled"
+    assert started.healthy is True
+    assert started.action == "started"
+    assert manager._inflight == {}
+
+
+def test_shutdown_kills_child_that_ignores_sigterm_after_grace() -> None:
+    manager = LocalOCRServiceManager()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN);"
+            " print('ready', flush=True); time.sleep(30)",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stdout is not None
+    assert process.stdout.readline().strip() == "ready"
+    manager._process = cast(Any, process)
+
+    started = time.monotonic()
+    manager.shutdown()
+    process.wait(timeout=5)
+    process.stdout.close()
+
+    assert time.monotonic() - started < 4
+    assert manager.current_process() is None
+
+
+def test_chat_request_template_splices_into_valid_json() -> None:
+    prefix, suffix = _chat_request_template("olm", 'Say "@@mdwb-tile-base64@@" verbatim')
+
+    body = json.loads(prefix + b"QUJD" + suffix)
+
+    assert _chat_request_template("olm", 'Say "@@mdwb-tile-base64@@" verbatim')[0] is prefix
+    assert body["model"] == "olm"
+    assert body["messages"][0]["content"][0]["text"] == 'Say "@@mdwb-tile-base64@@" verbatim'
+    assert body["messages"][0]["content"][1]["image_url"]["url"] == "data:image/png;base64,QUJD"
+
+
+def test_service_status_to_dict_omits_unset_fields_and_is_cached() -> None:
+    status = LocalOCRServiceStatus(
+        enabled=True,
+        endpoint="http://localhost:8001/v1",
+        healthy=True,
+        action="started",
+        pid=42,
+        command=("python", "-m", "vllm"),
+    )
+
+    payload = status.to_dict()
+    payload["command"].append("mutated")  # type: ignore[union-attr]
+
+    assert status.to_dict() == {
+        "enabled": True,
+        "endpoint": "http://localhost:8001/v1",
+        "healthy": True,
+        "action": "started",
+        "managed": False,
+        "launch_attempts": 0,
+        "restart_count": 0,
+        "pid": 42,
+        "command": ["python", "-m", "vllm"],
+    }
+    assert replace(status, action="reused").to_dict()["action"] == "reused"
@@ -33,7 +33,7 @@ class StubResponse:
             text = mdwb_cli.json.dumps(payload)
         self.text = text
         self._payload = payload
-        self.content: bytes | None = None
+        self.content: bytes | None = text.encode("utf-8")
 
     def json(self):  # noqa: ANN001
         if self._payload is not None:
@@ -76,6 +76,21 @@ def test_jobs_manifest_writes_pretty_json(monkeypatch, tmp_path: Path):
     )
 
 
+def test_jobs_links_keeps_unparsable_payload_verbatim(monkeypatch, tmp_path: Path):
+    response = StubResponse(200, text='[{"href": "https://example.com/é"}, ')
+    stub = StubClient({"/jobs/job123/links.json": response})
+    _patch_client_ctx(monkeypatch, stub)
+    monkeypatch.setattr(mdwb_cli, "_resolve_settings", lambda base: _fake_settings())
+    out_path = tmp_path / "links.json"
+
+    result = runner.invoke(
+        mdwb_cli.cli, ["jobs", "artifacts", "links", "job123", "--out", str(out_path)]
+    )
+
+    assert result.exit_code == 0
+    assert out_path.read_bytes() == response.content
+
+
 def test_jobs_markdown_prints_to_stdout(monkeypatch):
     response = StubResponse(200, text="# Hello")
     stub = StubClient({"/jobs/job321/result.md": response})
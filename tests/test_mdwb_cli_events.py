@@ -294,8 +294,9 @@ def test_iter_sse_parses_events():
         def __init__(self, lines: list[str]) -> None:
             self.lines = lines
 
-        def iter_lines(self):  # noqa: ANN001
-            yield from self.lines
+        def iter_bytes(self):  # noqa: ANN001
+            for line in self.lines:
+                yield f"{line}\n".encode()
 
     response = cast(
         httpx.Response,
@@ -316,6 +317,23 @@ def test_iter_sse_parses_events():
     assert events == [("message", "hello"), ("state", "DONE"), ("message", "tail")]
 
 
+def test_iter_sse_handles_split_chunks_and_crlf():
+    class DummyResponse:
+        def iter_bytes(self):  # noqa: ANN001
+            payload = "event: log\r\ndata: waiting…\r\n\r\nevent: state\ndata: DONE\n\n"
+            encoded = payload.encode()
+            # Split inside the multi-byte ellipsis and inside a CRLF pair.
+            yield encoded[:26]
+            yield encoded[26:29]
+            yield encoded[29:]
+
+    response = cast(httpx.Response, DummyResponse())
+
+    events = list(mdwb_cli._iter_sse(response))
+
+    assert events == [("log", "waiting…"), ("state", "DONE")]
+
+
 def test_stream_command_invokes_stream_job(monkeypatch):
     called: dict[str, Any] = {}
 
@@ -367,8 +385,9 @@ def test_stream_job_triggers_hooks_and_terminal(monkeypatch):
         def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
             return None
 
-        def iter_lines(self):  # noqa: ANN001
-            yield from self.payload
+        def iter_bytes(self):  # noqa: ANN001
+            for line in self.payload:
+                yield f"{line}\n".encode()
 
         def raise_for_status(self) -> None:
             return None
@@ -428,8 +447,9 @@ def test_stream_job_stops_after_terminal_state():
         def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
             return None
 
-        def iter_lines(self):  # noqa: ANN001
-            yield from self.payload
+        def iter_bytes(self):  # noqa: ANN001
+            for line in self.payload:
+                yield f"{line}\n".encode()
 
         def raise_for_status(self) -> None:
             return None
@@ -178,3 +178,21 @@ def test_resume_status_pending_list(tmp_path):
     assert "Pending entries" in output
     assert pending_url in output
     assert done_url in output
+
+
+def test_resume_manager_updates_caches_in_place_on_mark_complete(tmp_path, monkeypatch):
+    manager = mdwb_cli.ResumeManager(tmp_path)
+    manager.mark_complete("https://example.com/one")
+    assert manager.list_completed_entries() == ["https://example.com/one"]
+
+    def _no_rescan(*_args, **_kwargs):
+        raise AssertionError("done_flags rescanned")
+
+    monkeypatch.setattr(mdwb_cli.os, "scandir", _no_rescan)
+    manager.mark_complete("https://example.com/two")
+
+    assert manager.is_complete("https://example.com/two")
+    assert manager.list_completed_entries() == [
+        "https://example.com/one",
+        "https://example.com/two",
+    ]
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 from dataclasses import replace
 import io
 import json
+import threading
 from typing import Iterator
 
 import httpx
 import pytest
+import zstandard
 from PIL import Image, ImageDraw, ImageFont
 from playwright.async_api import async_playwright
 
@@ -27,6 +30,7 @@ from app.ocr_client import (
     reset_policy_runtime_state,
     reset_circuit_breakers,
     reset_quota_tracker,
+    reset_tile_cache,
     resolve_ocr_backend,
     submit_tiles,
 )
@@ -41,11 +45,13 @@ OLMOCR_API_KEY = decouple_config("OLMOCR_API_KEY", default="")
 @pytest.fixture(autouse=True)
 def _reset_quota_tracker_fixture() -> Iterator[None]:
     reset_quota_tracker()
+    reset_tile_cache()
     reset_circuit_breakers()
     reset_policy_runtime_state()
     reset_host_capabilities_cache()
     yield
     reset_quota_tracker()
+    reset_tile_cache()
     reset_circuit_breakers()
     reset_policy_runtime_state()
     reset_host_capabilities_cache()
@@ -229,6 +235,84 @@ def test_extract_glm_maas_markdown_common_response_shapes(
     assert extract_glm_maas_markdown(payload) == expected
 
 
+def test_group_tiles_flushes_on_count_bytes_and_model_change() -> None:
+    def _tile(tile_id: str, size: int, model: str = "m1") -> ocr_client_module._EncodedTile:
+        return ocr_client_module._EncodedTile(
+            tile_id=tile_id, image_b64=b"", size_bytes=size, model=model
+        )
+
+    tiles = [
+        _tile("a", 10),
+        _tile("b", 10),
+        _tile("c", 10),
+        _tile("d", 10, model="m2"),
+        _tile("e", 95, model="m2"),
+        _tile("f", 200, model="m2"),
+        _tile("g", 5, model="m2"),
+    ]
+
+    groups = ocr_client_module._group_tiles(tiles, max_tiles=2, max_bytes=100)
+
+    assert [[tile.tile_id for tile in group] for group in groups] == [
+        ["a", "b"],
+        ["c"],
+        ["d"],
+        ["e"],
+        ["f"],
+        ["g"],
+    ]
+
+
+def test_backoff_delay_grows_exponentially_with_jitter_and_cap(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("app.ocr_client.random.uniform", lambda low, high: high)
+
+    delays = [ocr_client_module._backoff_delay(attempt) for attempt in (1, 2, 3, 4, 10)]
+
+    assert delays == [0.75, 1.5, 3.0, 6.0, 45.0]
+
+
+def test_quota_tracker_warns_once_at_threshold() -> None:
+    tracker = ocr_client_module._QuotaTracker()
+
+    first = tracker.record(6, limit=10, ratio=0.7)
+    second = tracker.record(1, limit=10, ratio=0.7)
+    third = tracker.record(1, limit=10, ratio=0.7)
+
+    assert (first.used, first.warning_triggered) == (6, False)
+    assert (second.used, second.warning_triggered) == (7, True)
+    assert (third.used, third.warning_triggered) == (8, False)
+    assert tracker.record(1, limit=None, ratio=0.7).used is None
+
+
+def test_extract_markdown_batch_memoizes_response_shape_per_endpoint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("app.ocr_client._RESPONSE_SHAPES", {})
+    endpoint = "http://ocr.test/v1/chat/completions"
+    extract = ocr_client_module._extract_markdown_batch
+
+    first = extract(
+        {"data": [{"content": "a"}, {"text": "b"}]},
+        ("t1", "t2"),
+        backend_mode="openai-compatible",
+        endpoint=endpoint,
+    )
+    assert first == ["a", "b"]
+    assert ocr_client_module._RESPONSE_SHAPES[endpoint] == "data"
+
+    # A different shape on the same endpoint falls back to detection and re-learns.
+    second = extract(
+        {"choices": [{"message": {"content": "c"}}]},
+        ("t3",),
+        backend_mode="openai-compatible",
+        endpoint=endpoint,
+    )
+    assert second == ["c"]
+    assert ocr_client_module._RESPONSE_SHAPES[endpoint] == "openai"
+
+
 def test_resolve_ocr_backend_produces_contract_v2_fields() -> None:
     runtime = resolve_ocr_backend(get_settings())
     assert runtime.backend_id
@@ -240,6 +324,15 @@ def test_resolve_ocr_backend_produces_contract_v2_fields() -> None:
     assert runtime.reevaluate_after_s >= 1
 
 
+def test_resolve_ocr_backend_reuses_decision_per_settings_and_hardware() -> None:
+    settings = get_settings()
+    first = resolve_ocr_backend(settings)
+
+    assert resolve_ocr_backend(settings) is first
+    changed = replace(settings, ocr=replace(settings.ocr, server_url="https://other.example/v1"))
+    assert resolve_ocr_backend(changed) is not first
+
+
 def test_resolve_ocr_backend_local_auto_uses_gpu_when_available() -> None:
     settings = get_settings()
     mutated = replace(settings, ocr=replace(settings.ocr, local_url="http://localhost:8001/v1"))
@@ -343,6 +436,242 @@ async def test_submit_tiles_glm_maas_contract_and_telemetry() -> None:
     for file_value in seen_files:
         assert isinstance(file_value, str)
         assert file_value.startswith("data:image/png;base64,")
+    decoded = sorted(base64.b64decode(str(value).split(",", 1)[1]) for value in seen_files)
+    assert decoded == [b"tile-one", b"tile-two"]
+
+
+@pytest.mark.asyncio
+async def test_submit_tiles_bounds_in_flight_batches_to_max_concurrency() -> None:
+    settings = get_settings()
+    maas_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            server_url="https://open.bigmodel.cn/api/paas/v4/layout_parsing",
+            local_url=None,
+            api_key="test-maas-key",
+            model="glm-ocr",
+            min_concurrency=2,
+            max_concurrency=2,
+        ),
+    )
+    requests = [
+        OCRRequest(tile_id=f"tile-{idx:03d}", tile_bytes=f"t{idx}".encode()) for idx in range(12)
+    ]
+    in_flight = 0
+    peak = 0
+
+    async def _handler(http_request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return httpx.Response(200, json={"markdown": "ok"})
+
+    transport = httpx.MockTransport(_handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await submit_tiles(requests=requests, settings=maas_settings, client=client)
+
+    assert peak <= 2
+    assert result.markdown_chunks == ["ok"] * 12
+    assert len(result.batches) == 12
+
+
+@pytest.mark.asyncio
+async def test_submit_tiles_cancels_in_flight_batches_when_one_fails() -> None:
+    settings = get_settings()
+    maas_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            server_url="https://open.bigmodel.cn/api/paas/v4/layout_parsing",
+            local_url=None,
+            api_key="test-maas-key",
+            model="glm-ocr",
+            min_concurrency=2,
+            max_concurrency=2,
+        ),
+    )
+    requests = [
+        OCRRequest(tile_id="tile-slow", tile_bytes=b"slow"),
+        OCRRequest(tile_id="tile-bad", tile_bytes=b"bad"),
+    ]
+    cancelled = False
+
+    async def _handler(http_request: httpx.Request) -> httpx.Response:
+        nonlocal cancelled
+        if base64.b64encode(b"bad") in http_request.content:
+            return httpx.Response(401, json={"error": "unauthorized"})
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return httpx.Response(200, json={"markdown": "never"})
+
+    transport = httpx.MockTransport(_handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(RuntimeError, match="failover exhausted"):
+            await submit_tiles(requests=requests, settings=maas_settings, client=client)
+
+    assert cancelled is True
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused_per_timeout_profile() -> None:
+    timeout = ocr_client_module.REQUEST_TIMEOUT
+    first = ocr_client_module._get_http_client(timeout, max_connections=4)
+    again = ocr_client_module._get_http_client(httpx.Timeout(timeout), max_connections=4)
+    cpu = ocr_client_module._get_http_client(httpx.Timeout(10.0, read=180.0), max_connections=4)
+    wider = ocr_client_module._get_http_client(timeout, max_connections=16)
+
+    assert first is again
+    assert cpu is not first
+    assert wider is not first
+    assert ocr_client_module._submit_headers("k") is ocr_client_module._submit_headers("k")
+    assert "Authorization" not in ocr_client_module._submit_headers(None)
+
+    await ocr_client_module.close_ocr_clients()
+
+    assert first.is_closed and cpu.is_closed
+    assert ocr_client_module._get_http_client(timeout, max_connections=4) is not first
+    await ocr_client_module.close_ocr_clients()
+
+
+@pytest.mark.asyncio
+async def test_submit_tiles_serves_repeated_tiles_from_content_cache() -> None:
+    settings = get_settings()
+    maas_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            server_url="https://open.bigmodel.cn/api/paas/v4/layout_parsing",
+            local_url=None,
+            api_key="test-maas-key",
+            model="glm-ocr",
+            min_concurrency=1,
+            max_concurrency=1,
+            cache_max_entries=8,
+        ),
+    )
+    calls = 0
+
+    def _handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"markdown": f"chunk-{calls}"})
+
+    transport = httpx.MockTransport(_handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        first = await submit_tiles(
+            requests=[OCRRequest(tile_id="a", tile_bytes=b"header")],
+            settings=maas_settings,
+            client=client,
+        )
+        second = await submit_tiles(
+            requests=[
+                OCRRequest(tile_id="b", tile_bytes=b"body"),
+                OCRRequest(tile_id="c", tile_bytes=b"header"),
+            ],
+            settings=maas_settings,
+            client=client,
+        )
+        third = await submit_tiles(
+            requests=[OCRRequest(tile_id="d", tile_bytes=b"body")],
+            settings=maas_settings,
+            client=client,
+        )
+
+    assert calls == 2
+    assert first.markdown_chunks == ["chunk-1"]
+    assert second.markdown_chunks == ["chunk-2", "chunk-1"]
+    assert second.cache_hits == 1
+    assert [batch.tile_ids for batch in second.batches] == [("b",)]
+    assert third.markdown_chunks == ["chunk-2"]
+    assert third.cache_hits == 1
+    assert third.batches == []
+
+
+@pytest.mark.asyncio
+async def test_submit_tiles_coalesces_duplicate_tiles_within_a_call() -> None:
+    settings = get_settings()
+    maas_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            server_url="https://open.bigmodel.cn/api/paas/v4/layout_parsing",
+            local_url=None,
+            api_key="test-maas-key",
+            model="glm-ocr",
+            min_concurrency=1,
+            max_concurrency=1,
+            cache_max_entries=0,
+        ),
+    )
+    requests = [
+        OCRRequest(tile_id="t0", tile_bytes=b"footer"),
+        OCRRequest(tile_id="t1", tile_bytes=b"page"),
+        OCRRequest(tile_id="t2", tile_bytes=b"footer"),
+    ]
+    seen_files: list[str] = []
+
+    def _handler(http_request: httpx.Request) -> httpx.Response:
+        seen_files.append(json.loads(http_request.content)["file"])
+        return httpx.Response(200, json={"markdown": f"chunk-{len(seen_files)}"})
+
+    transport = httpx.MockTransport(_handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await submit_tiles(requests=requests, settings=maas_settings, client=client)
+
+    assert len(seen_files) == 2
+    assert result.markdown_chunks[0] == result.markdown_chunks[2]
+    assert result.markdown_chunks[0] != result.markdown_chunks[1]
+    assert sorted(tile_id for batch in result.batches for tile_id in batch.tile_ids) == ["t0", "t1"]
+    assert result.cache_hits == 0
+
+
+@pytest.mark.asyncio
+async def test_submit_tiles_encodes_large_batches_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = get_settings()
+    maas_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            server_url="https://open.bigmodel.cn/api/paas/v4/layout_parsing",
+            local_url=None,
+            api_key="test-maas-key",
+            model="glm-ocr",
+            min_concurrency=1,
+            max_concurrency=1,
+        ),
+    )
+    encode_threads: list[str] = []
+    original_encode = ocr_client_module._encode_requests
+
+    def _tracking_encode(*args: object) -> list[object]:
+        encode_threads.append(threading.current_thread().name)
+        return original_encode(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr("app.ocr_client._encode_requests", _tracking_encode)
+    monkeypatch.setattr("app.ocr_client._OFFLOAD_ENCODE_BYTES", 4)
+
+    def _handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"markdown": "ok"})
+
+    transport = httpx.MockTransport(_handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await submit_tiles(
+            requests=[OCRRequest(tile_id="big", tile_bytes=b"large-tile")],
+            settings=maas_settings,
+            client=client,
+        )
+
+    assert result.markdown_chunks == ["ok"]
+    assert len(encode_threads) == 1
+    assert encode_threads[0] != threading.main_thread().name
 
 
 @pytest.mark.asyncio
@@ -369,9 +698,12 @@ async def test_submit_tiles_glm_maas_retries_5xx_then_succeeds(monkeypatch: pyte
 
     monkeypatch.setattr("app.ocr_client._sleep", _fake_sleep)
 
-    def _handler(_: httpx.Request) -> httpx.Response:
+    seen_bodies: list[bytes] = []
+
+    def _handler(http_request: httpx.Request) -> httpx.Response:
         nonlocal attempt_count
         attempt_count += 1
+        seen_bodies.append(http_request.content)
         if attempt_count == 1:
             return httpx.Response(503, json={"error": "busy"})
         return httpx.Response(200, json={"task_id": "maas-ok", "data": {"result": {"content": "Recovered"}}})
@@ -381,13 +713,58 @@ async def test_submit_tiles_glm_maas_retries_5xx_then_succeeds(monkeypatch: pyte
         result = await submit_tiles(requests=[request], settings=maas_settings, client=client)
 
     assert attempt_count == 2
-    assert slept == [3.0]
+    assert len(slept) == 1 and 0.25 <= slept[0] <= 0.75
+    assert seen_bodies[0] == seen_bodies[1]
+    assert json.loads(seen_bodies[0])["model"] == "glm-ocr"
     assert result.markdown_chunks == ["Recovered"]
     assert len(result.batches) == 1
     assert result.batches[0].attempts == 2
     assert result.batches[0].request_id == "maas-ok"
 
 
+@pytest.mark.asyncio
+async def test_submit_tiles_glm_maas_does_not_retry_permanent_4xx(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = get_settings()
+    maas_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            server_url="https://open.bigmodel.cn/api/paas/v4/layout_parsing",
+            local_url=None,
+            api_key="bad-key",
+            model="glm-ocr",
+            min_concurrency=1,
+            max_concurrency=1,
+        ),
+    )
+    slept: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        slept.append(delay)
+
+    monkeypatch.setattr("app.ocr_client._sleep", _fake_sleep)
+    calls = 0
+
+    def _handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(401, json={"error": "unauthorized"})
+
+    transport = httpx.MockTransport(_handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(RuntimeError, match="failover exhausted"):
+            await submit_tiles(
+                requests=[OCRRequest(tile_id="tile-401", tile_bytes=b"tile")],
+                settings=maas_settings,
+                client=client,
+            )
+
+    assert calls == 1
+    assert slept == []
+
+
 @pytest.mark.asyncio
 async def test_submit_tiles_local_openai_keeps_configured_served_model_name(
     monkeypatch: pytest.MonkeyPatch,
@@ -432,6 +809,87 @@ async def test_submit_tiles_local_openai_keeps_configured_served_model_name(
     assert result.local_service["action"] == "reused"
 
 
+@pytest.mark.asyncio
+async def test_submit_tiles_local_openai_binary_upload_sends_multipart(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _mock_local_service_ready(monkeypatch)
+    settings = get_settings()
+    local_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            local_url="http://localhost:8001/v1",
+            model="olmOCR-2-7B-1025-FP8",
+            binary_upload=True,
+            min_concurrency=1,
+            max_concurrency=1,
+        ),
+    )
+    request = OCRRequest(tile_id="tile-bin-001", tile_bytes=b"\x89PNG-raw-bytes")
+    seen_content_type: str | None = None
+    seen_body = b""
+
+    def _handler(http_request: httpx.Request) -> httpx.Response:
+        nonlocal seen_content_type, seen_body
+        seen_content_type = http_request.headers.get("Content-Type")
+        seen_body = http_request.read()
+        return httpx.Response(200, json={"choices": [{"message": {"content": "binary-ok"}}]})
+
+    transport = httpx.MockTransport(_handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await submit_tiles(requests=[request], settings=local_settings, client=client)
+
+    assert seen_content_type is not None
+    assert seen_content_type.startswith("multipart/form-data; boundary=")
+    assert b"\x89PNG-raw-bytes" in seen_body
+    assert b'name="model"' in seen_body and b"olmOCR-2-7B-1025-FP8" in seen_body
+    assert base64.b64encode(b"\x89PNG-raw-bytes") not in seen_body
+    assert result.markdown_chunks == ["binary-ok"]
+
+
+@pytest.mark.asyncio
+async def test_submit_tiles_zstd_compresses_large_json_bodies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _mock_local_service_ready(monkeypatch)
+    settings = get_settings()
+    local_settings = replace(
+        settings,
+        ocr=replace(
+            settings.ocr,
+            local_url="http://localhost:8001/v1",
+            model="olmOCR-2-7B-1025-FP8",
+            request_zstd_min_bytes=1024,
+            min_concurrency=1,
+            max_concurrency=1,
+        ),
+    )
+    requests = [
+        OCRRequest(tile_id="tile-small", tile_bytes=b"tiny"),
+        OCRRequest(tile_id="tile-large", tile_bytes=b"\x89PNG" + b"row" * 4096),
+    ]
+    seen: dict[str, str | None] = {}
+
+    def _handler(http_request: httpx.Request) -> httpx.Response:
+        encoding = http_request.headers.get("Content-Encoding")
+        body = http_request.read()
+        if encoding == "zstd":
+            body = zstandard.ZstdDecompressor().decompress(body)
+        payload = json.loads(body)
+        image_url = payload["messages"][0]["content"][1]["image_url"]["url"]
+        key = "large" if len(image_url) > 1024 else "small"
+        seen[key] = encoding
+        return httpx.Response(200, json={"choices": [{"message": {"content": key}}]})
+
+    transport = httpx.MockTransport(_handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await submit_tiles(requests=requests, settings=local_settings, client=client)
+
+    assert result.markdown_chunks == ["small", "large"]
+    assert seen == {"small": None, "large": "zstd"}
+
+
 @pytest.mark.asyncio
 async def test_submit_tiles_local_glm_alias_fallback_on_model_not_found(
     monkeypatch: pytest.MonkeyPatch,
@@ -707,7 +1165,7 @@ async def test_submit_tiles_local_cpu_retry_triggers_policy_reevaluation(
     async with httpx.AsyncClient(transport=transport) as client:
         result = await submit_tiles(requests=[request], settings=local_settings, client=client)
 
-    assert slept == [3.0]
+    assert len(slept) == 1 and 0.25 <= slept[0] <= 0.75
     assert result.backend.hardware_path == "cpu"
     assert result.markdown_chunks == ["cpu-ok"]
     assert result.batches[0].attempts == 2
@@ -729,6 +1187,8 @@ async def test_submit_tiles_local_cpu_latency_uses_hysteresis_suppression(
             model="glm-ocr",
             min_concurrency=1,
             max_concurrency=2,
+            # Both submissions must reach the backend to exercise the cooldown.
+            cache_max_entries=0,
         ),
     )
     cpu_snapshot = HardwareCapabilitySnapshot(
@@ -753,8 +1213,11 @@ async def test_submit_tiles_local_cpu_latency_uses_hysteresis_suppression(
         use_fp8: bool,
         backend_mode: str,
         backend_id: str,
+        binary_upload: bool = False,
+        zstd_min_bytes: int = 0,
     ):
-        del endpoint, headers, http_client, use_fp8, backend_mode, backend_id
+        del endpoint, headers, http_client, use_fp8, backend_mode, backend_id, binary_upload
+        del zstd_min_bytes
         tile_ids = tuple(tile.tile_id for tile in tile_batch)
         telemetry = ocr_client_module.OCRBatchTelemetry(
             tile_ids=tile_ids,
@@ -859,6 +1322,8 @@ async def test_submit_tiles_failover_skips_open_circuit_backend(
             api_key="remote-key",
             min_concurrency=1,
             max_concurrency=1,
+            # Every submission must reach the failover chain to trip the breaker.
+            cache_max_entries=0,
         ),
     )
     cpu_snapshot = HardwareCapabilitySnapshot(
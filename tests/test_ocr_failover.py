@@ -12,6 +12,7 @@ from app.ocr_client import (
     reset_circuit_breakers,
     reset_policy_runtime_state,
     reset_quota_tracker,
+    reset_tile_cache,
     submit_tiles,
 )
 from app.settings import get_settings
@@ -20,11 +21,13 @@ from app.settings import get_settings
 @pytest.fixture(autouse=True)
 def _reset_runtime_state() -> Iterator[None]:
     reset_quota_tracker()
+    reset_tile_cache()
     reset_circuit_breakers()
     reset_policy_runtime_state()
     reset_host_capabilities_cache()
     yield
     reset_quota_tracker()
+    reset_tile_cache()
     reset_circuit_breakers()
     reset_policy_runtime_state()
     reset_host_capabilities_cache()
@@ -132,6 +135,7 @@ async def test_local_failures_open_circuit_and_next_run_skips_local(
             api_key="remote-key",
             min_concurrency=1,
             max_concurrency=1,
+            cache_max_entries=0,
         ),
     )
     monkeypatch.setattr("app.ocr_client.get_host_capabilities", _cpu_snapshot)
@@ -226,3 +226,26 @@ def test_should_reevaluate_policy_hard_failure_bypasses_suppression() -> None:
     assert result.should_reevaluate is True
     assert result.reason_code == REASON_REEVAL_FAILURE
     assert result.hard_failure_bypass is True
+
+
+def test_switch_history_is_bounded_without_flap_window() -> None:
+    decision = OCRPolicyDecision(
+        backend_id="glm-ocr-local-openai",
+        backend_mode="openai-compatible",
+        hardware_path="cpu",
+        fallback_chain=("glm-ocr-remote-openai",),
+        reason_codes=(REASON_LOCAL_CPU_FALLBACK,),
+        reevaluate_after_s=30,
+    )
+    hysteresis = OCRHysteresisSettings(cooldown_seconds=0, flap_window_seconds=0, flap_threshold=0)
+    state = OCRPolicyRuntimeState()
+    for tick in range(100):
+        state = should_reevaluate_policy(
+            signal=OCRRuntimeSignal.REQUEST_FAILED,
+            decision=decision,
+            context=OCRReevaluationContext(now_ts=float(tick), state=state, hysteresis=hysteresis),
+        ).state
+
+    assert len(state.switch_timestamps) == 32
+    assert state.switch_timestamps[0] == 68.0
+    assert state.switch_timestamps[-1] == 99.0
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.settings import get_settings, reset_settings_cache
+
+
+def test_get_settings_is_memoized_until_cache_reset(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("OCR_MAX_CONCURRENCY=3\n", encoding="utf-8")
+    try:
+        first = get_settings(str(env_file))
+        assert get_settings(str(env_file)) is first
+        assert first.ocr.max_concurrency == 3
+
+        env_file.write_text("OCR_MAX_CONCURRENCY=5\n", encoding="utf-8")
+        assert get_settings(str(env_file)).ocr.max_concurrency == 3
+
+        reset_settings_cache()
+        assert get_settings(str(env_file)).ocr.max_concurrency == 5
+    finally:
+        reset_settings_cache()
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import io
+import time
+
 from app.dom_links import DomHeading, DomTextOverlay, normalize_heading_text
-from app.stitch import stitch_markdown
+from app.stitch import (
+    DomOverlayIndex,
+    HeadingGuide,
+    _apply_dom_overlays,
+    _line_issue,
+    stitch_markdown,
+)
 from app.tiler import TileSlice
 
 
@@ -155,6 +164,23 @@ def test_table_header_similarity_trim() -> None:
     assert "table-header-trimmed reason=similar" in output
 
 
+def test_table_header_similarity_trim_handles_wide_separator_rows() -> None:
+    tiles = [
+        _tile(0, 0, bottom_sha="aaa"),
+        _tile(1, 400, top_sha="aaa"),
+    ]
+    header = "| " + " | ".join(f"Column {idx}" for idx in range(12)) + " |"
+    separator = "|" + "|".join(["----------"] * 12) + "|"
+    aligned = "|" + "|".join([":---------"] + ["----------"] * 11) + "|"
+    chunk1 = f"{header}\n{separator}\n| A |\n"
+    chunk2 = f"{header}\n{aligned}\n| B |\n"
+
+    result = stitch_markdown([chunk1, chunk2], tiles, deduplicate_overlaps=False)
+
+    assert result.markdown.count("| Column 0") == 1
+    assert "table-header-trimmed reason=similar" in result.markdown
+
+
 def test_table_header_trim_skips_leading_blank_lines_and_comments() -> None:
     tiles = [
         _tile(0, 0, bottom_sha="aaa"),
@@ -256,3 +282,82 @@ def test_dom_assist_detects_spaced_letters() -> None:
 
     assert "Revenue" in result.markdown
     assert result.dom_assists[0].reason == "spaced-letters"
+
+
+def test_dom_overlay_probe_filters_lines_without_key_characters() -> None:
+    index = DomOverlayIndex(
+        [DomTextOverlay(text="Revenue Growth", normalized="revenue growth", source="h2")]
+    )
+
+    assert index.may_match("## R E V E N U E  G R O W T H", None)
+    assert index.may_match("Revenue Gro-", "wth")
+    assert not index.may_match("Revenue Gro", "wth")
+    assert not index.may_match("Quarterly 2024 ???", None)
+    assert not DomOverlayIndex([]).may_match("Revenue Growth", None)
+
+
+def test_dom_overlay_pass_cost_does_not_grow_with_overlay_count() -> None:
+    overlays = [
+        DomTextOverlay(
+            text=f"Section {idx} Overview", normalized=f"section {idx} overview", source="h2"
+        )
+        for idx in range(1000)
+    ]
+    lines = [f"Paragraph {idx}: revenue grew!!! in region {idx % 7}?" for idx in range(5000)]
+    lines[2500] = "## Section 42 Overview!!!"
+
+    start = time.perf_counter()
+    updated, assists = _apply_dom_overlays(lines, DomOverlayIndex(overlays), tile_index=0)
+    elapsed = time.perf_counter() - start
+
+    assert [entry.dom_text for entry in assists] == ["Section 42 Overview"]
+    assert updated[2500] == "## Section 42 Overview"
+    # One set lookup per line: a regex alternation over 1000 keys took seconds here.
+    assert elapsed < 1.0
+
+
+def test_line_issue_rule_priority() -> None:
+    assert _line_issue("Rev�nue 2024!!!", None) == "replacement-char"
+    assert _line_issue("Wait?! what…", None) == "punctuation"
+    assert _line_issue("Revenue Q4", None) == "mixed-numeric"
+    assert _line_issue("-- | -- | --", None) == "low-alpha"
+    assert _line_issue("Revenue Gro-", "wth") == "hyphen-break"
+    assert _line_issue("Revenue Growth", None) is None
+
+
+def test_heading_guide_follows_outline_order() -> None:
+    outline = [
+        DomHeading(text="Intro", level=1, normalized="intro"),
+        DomHeading(text="Details", level=2, normalized="details"),
+        DomHeading(text="Intro", level=3, normalized="intro"),
+        DomHeading(text="Details", level=4, normalized="details"),
+    ]
+    guide = HeadingGuide(outline)
+
+    assert guide.target_level("Unknown") is None
+    assert guide.target_level("Details") == 2
+    # "Intro" at position 0 is behind the cursor; the next occurrence wins.
+    assert guide.target_level("Intro") == 3
+    assert guide.target_level("Details") == 4
+    assert guide.target_level("Intro") is None
+
+
+def test_provenance_includes_encoded_highlight_url() -> None:
+    tiles = [_tile(7, 0, height=80)]
+
+    result = stitch_markdown(["body"], tiles, job_id="job-1")
+
+    assert (
+        "highlight=/jobs/job-1/artifact/highlight?tile=artifact%2Ftiles%2Ftile_0007.png&y0=0&y1=80"
+    ) in result.markdown
+
+
+def test_stitch_streams_markdown_to_sink() -> None:
+    tiles = [_tile(0, 0), _tile(1, 100)]
+    chunks = ["# Title\n\nfirst", "second"]
+    sink = io.StringIO()
+
+    streamed = stitch_markdown(chunks, tiles, sink=sink)
+
+    assert streamed.markdown == ""
+    assert sink.getvalue() == stitch_markdown(chunks, tiles).markdown
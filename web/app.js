@@ -605,7 +605,7 @@ function buildCoverageBadges(entry, isCrawled) {
   }
   if (entry.kind === 'form') {
     badges.push(createBadge('Form', 'info'));
-  } else if (entry.kind === 'markdown' && entry.source === 'OCR') {
+  } else if (entry.source === 'OCR') {
     badges.push(createBadge('OCR text', 'muted'));
   }
   const crawledBadge = createBadge('Crawled', 'muted');